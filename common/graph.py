@@ -0,0 +1,84 @@
+import heapq
+
+from common.instrument import count
+
+
+class WeightedGraph:
+    """A directed graph with nodes numbered 0 to n - 1 in the order they were added. Each node also has a value,
+    such as a position in a maze, and get_index() finds a node from its value. edges[n] lists (neighbor, weight)
+    pairs for node n."""
+
+    def __init__(self):
+        self._indexes = {}
+        self.values = []
+        self.edges: list[list[tuple[int, int]]] = []
+
+    def __len__(self):
+        return len(self.values)
+
+    def add_node(self, value) -> int:
+        index = len(self.values)
+        self._indexes[value] = index
+        self.values.append(value)
+        self.edges.append([])
+        return index
+
+    def get_index(self, value) -> int | None:
+        return self._indexes.get(value, None)
+
+    def link(self, node: int, neighbor: int, weight: int):
+        self.edges[node].append((neighbor, weight))
+
+
+def dijkstra(graph: WeightedGraph, start: int) -> list[int | None]:
+    """Return the shortest distance from start to every node, or None for nodes that can't be reached."""
+    distances, _ = search(graph, start, False)
+    return distances
+
+
+def dijkstra_with_predecessors(graph: WeightedGraph, start: int) -> tuple[list[int | None], list[list[int]]]:
+    """Like dijkstra(), but also return, for every node, all the nodes it is reached from on a shortest path."""
+    return search(graph, start, True)
+
+
+def search(graph, start, track_predecessors):
+    """Dijkstra's algorithm with a binary heap. Rather than decrease a node's key, it is pushed again with
+    the lower distance, and the entry left behind is skipped when it is popped."""
+    distances = [None] * len(graph)
+    predecessors = [[] for _ in range(len(graph))] if track_predecessors else None
+    edges = graph.edges
+    distances[start] = 0
+    heap = [(0, start)]
+    pops = stale = 0
+    while heap:
+        distance, node = heapq.heappop(heap)
+        pops += 1
+        if distance > distances[node]:
+            stale += 1
+            continue
+        for neighbor, weight in edges[node]:
+            candidate = distance + weight
+            best = distances[neighbor]
+            if best is None or candidate < best:
+                distances[neighbor] = candidate
+                heapq.heappush(heap, (candidate, neighbor))
+                if track_predecessors:
+                    predecessors[neighbor] = [node]
+            elif candidate == best and track_predecessors:
+                predecessors[neighbor].append(node)
+    # every node pushed is popped again, and all but the first push came from shortening a distance
+    count('heap pushes', pops)
+    count('stale heap entries', stale)
+    return distances, predecessors
+
+
+def get_nodes_on_shortest_paths(predecessors: list[list[int]], ends: list[int]) -> set[int]:
+    """Every node on any shortest path that finishes at one of ends."""
+    result = set(ends)
+    stack = list(ends)
+    while stack:
+        for previous in predecessors[stack.pop()]:
+            if previous not in result:
+                result.add(previous)
+                stack.append(previous)
+    return result
@@ -0,0 +1,71 @@
+class Grid:
+    """A rectangular grid of one byte cells stored row by row in a single bytearray.
+
+    The real cells are surrounded by padding cells holding the border value, so a step of up to padding
+    cells in any direction from a real cell is still a valid index. Code can compare against the border
+    instead of checking bounds. Cells are addressed by their flat index; index() and position() convert
+    to and from (row, col)."""
+
+    def __init__(self, rows: int, cols: int, fill: str = '.', border: str = '\0', padding: int = 1):
+        self.rows = rows
+        self.cols = cols
+        self.padding = padding
+        self.border = ord(border)
+        self.stride = cols + 2 * padding
+        self.cells = bytearray([self.border]) * (self.stride * (rows + 2 * padding))
+        for row in range(rows):
+            start = self.index(row, 0)
+            self.cells[start:start + cols] = bytes([ord(fill)]) * cols
+        # the steps to the neighbors of a cell, in the order N, E, S, W and then the diagonals NE, SE, SW, NW
+        self.orthogonal = (-self.stride, 1, self.stride, -1)
+        self.diagonal = (1 - self.stride, 1 + self.stride, self.stride - 1, -self.stride - 1)
+
+    @classmethod
+    def from_lines(cls, lines, border: str = '\0', padding: int = 1):
+        lines = [line.encode() if isinstance(line, str) else line for line in lines]
+        result = cls(len(lines), len(lines[0]) if lines else 0, border=border, padding=padding)
+        for row, line in enumerate(lines):
+            start = result.index(row, 0)
+            result.cells[start:start + len(line)] = line
+        return result
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int):
+        self.cells[index] = value
+
+    def index(self, row: int, col: int) -> int:
+        return (row + self.padding) * self.stride + col + self.padding
+
+    def position(self, index: int) -> tuple[int, int]:
+        row, col = divmod(index, self.stride)
+        return row - self.padding, col - self.padding
+
+    def is_inside(self, index: int) -> bool:
+        row, col = self.position(index)
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def indexes(self):
+        """Iterate over the indexes of the real cells, row by row."""
+        for row in range(self.rows):
+            start = self.index(row, 0)
+            yield from range(start, start + self.cols)
+
+    def find(self, char: str) -> int | None:
+        """The index of the first cell holding char, or None if there isn't one."""
+        index = self.cells.find(ord(char))
+        return None if index == -1 else index
+
+    def positions(self, char: str) -> list[int]:
+        """The indexes of every cell holding char."""
+        result = []
+        value = ord(char)
+        index = self.cells.find(value)
+        while index != -1:
+            result.append(index)
+            index = self.cells.find(value, index + 1)
+        return result
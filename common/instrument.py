@@ -0,0 +1,73 @@
+"""Lets solutions report how long their phases take and count the work they do. Wrap a phase in span():
+
+    with span('build graph'):
+        graph = get_weighted_graph(lines)
+
+and add to a counter with count('requeues') or count('heap pops', n). Both do nothing until enable() is called,
+which main.py --json does, and then it includes the totals. A span that is entered more than once adds up its
+time. In a hot loop, keep a local tally and count() it once afterwards rather than calling count() every time."""
+import time
+
+_enabled = False
+_spans: dict[str, int] = {}
+_counters: dict[str, int] = {}
+
+
+class _Span:
+
+    __slots__ = ['_name', '_start']
+
+    def __init__(self, name):
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info):
+        _spans[self._name] = _spans.get(self._name, 0) + time.perf_counter_ns() - self._start
+
+
+class _DisabledSpan:
+
+    __slots__ = []
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_disabled_span = _DisabledSpan()
+
+
+def span(name: str):
+    return _Span(name) if _enabled else _disabled_span
+
+
+def count(name: str, amount: int = 1):
+    if _enabled:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def get_spans() -> dict[str, int]:
+    """Nanoseconds spent in each span, in the order they were first entered."""
+    return dict(_spans)
+
+
+def get_counters() -> dict[str, int]:
+    return dict(_counters)
+
+
+def reset():
+    _spans.clear()
+    _counters.clear()
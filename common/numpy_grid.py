@@ -0,0 +1,23 @@
+"""The NumPy counterpart of common.grid, for the vectorized solutions. Importing this module raises ImportError
+when NumPy isn't installed, which is how the loader knows to fall back to the pure Python solutions."""
+import numpy as np
+
+# (row, col) steps to the neighbors of a cell, clockwise from north
+orthogonal = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+
+
+def load_grid(lines, padding=0, border=0):
+    """Read the input into a 2D array of byte values, surrounded by padding cells holding border."""
+    lines = list(lines)
+    grid = np.frombuffer(''.join(lines).encode(), dtype=np.uint8).reshape(len(lines), -1)
+    if padding:
+        grid = np.pad(grid, padding, constant_values=border)
+    return grid
+
+
+def window(padded, padding, row_step, col_step):
+    """A view of a padded array with every cell moved by (row_step, col_step): element [r, c] of the result is
+    the cell (r + row_step, c + col_step) of the unpadded grid."""
+    rows, cols = padded.shape[0] - 2 * padding, padded.shape[1] - 2 * padding
+    top, left = padding + row_step, padding + col_step
+    return padded[top:top + rows, left:left + cols]
@@ -0,0 +1,45 @@
+"""Bulk parsing of the input. Rather than splitting and converting a line at a time, the integer functions join
+many lines into one buffer, turn everything that can't be part of an integer into spaces with a single
+bytes.translate() and let split() find the integers."""
+import re
+from itertools import islice
+
+integer_pattern = re.compile(r'-?[0-9]+')
+# keeps digits, minus signs and line breaks, and turns every other byte into a space
+_integer_bytes = bytes(byte if chr(byte) in '0123456789-\n' else 32 for byte in range(256))
+
+
+def get_integers(lines) -> list[int]:
+    """Every integer in the input, in order."""
+    text = '\n'.join(lines)
+    try:
+        return list(map(int, text.encode().translate(_integer_bytes).split()))
+    except ValueError:
+        # a minus sign that isn't part of a number, e.g. in '->'
+        return list(map(int, integer_pattern.findall(text)))
+
+
+def get_integer_rows(lines, batch_size=4096):
+    """Yield the integers on each line as a list. Lines are read in batches, so this can take its lines lazily
+    from the file without holding all of them."""
+    lines = iter(lines)
+    while batch := list(islice(lines, batch_size)):
+        text = '\n'.join(batch)
+        try:
+            rows = [list(map(int, row.split())) for row in text.encode().translate(_integer_bytes).split(b'\n')]
+        except ValueError:
+            rows = [list(map(int, integer_pattern.findall(row))) for row in batch]
+        yield from rows
+
+
+def get_input_blocks(lines):
+    """Partition the input by blank rows."""
+    result = []
+    for line in lines:
+        if line == '':
+            yield result
+            result = []
+        else:
+            result.append(line)
+    if result:
+        yield result
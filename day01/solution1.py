@@ -1,18 +1,20 @@
+from operator import sub
+
+from common.parsing import get_integers
+
+
 def run(lines):
     left, right = get_lists(lines)
-    result = 0
-    for pair in zip(left, right):
-        distance = abs(pair[0] - pair[1])
-        result += distance
-    return result
+    left.sort()
+    right.sort()
+    return sum(map(abs, map(sub, left, right)))
+
+
+# run() only iterates over the lines once, so it can take them straight from the file
+run_stream = run
 
 
 def get_lists(lines):
-    left, right = [], []
-    for line in lines:
-        split = [int(x) for x in line.split()]
-        left.append(split[0])
-        right.append(split[1])
-    left.sort()
-    right.sort()
-    return left, right
+    """Both columns of ids, parsed in one pass over the whole input."""
+    integers = get_integers(lines)
+    return integers[0::2], integers[1::2]
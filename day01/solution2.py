@@ -1,29 +1,15 @@
-from collections import defaultdict
+from collections import Counter
+from itertools import repeat
+from operator import mul
+
+from day01.solution1 import get_lists
 
 
 def run(lines):
     left, right = get_lists(lines)
-    counts = count_occurrences(right)
-    result = 0
-    for item in left:
-        result += (item * counts[item])
-    return result
-
-
-def get_lists(lines):
-    line: str
-    left, right = [], []
-    for line in lines:
-        split = [int(x) for x in line.split()]
-        left.append(split[0])
-        right.append(split[1])
-    left.sort()
-    right.sort()
-    return left, right
+    counts = Counter(right)
+    return sum(map(mul, left, map(counts.get, left, repeat(0))))
 
 
-def count_occurrences(list):
-    result = defaultdict(int)
-    for item in list:
-        result[item] += 1
-    return result
+# run() only iterates over the lines once, so it can take them straight from the file
+run_stream = run
@@ -0,0 +1,5 @@
+from day01.solution1_numpy import get_columns, get_totals
+
+
+def run(lines):
+    return get_totals(*get_columns(lines))[1]
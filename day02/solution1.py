@@ -1,3 +1,6 @@
+from common.parsing import get_integer_rows
+
+
 def run(lines):
     reports = get_reports(lines)
     result = 0
@@ -7,12 +10,12 @@ def run(lines):
     return result
 
 
+# run() only iterates over the lines once, so it can take them straight from the file
+run_stream = run
+
+
 def get_reports(lines):
-    result = []
-    for line in lines:
-        split = line.split()
-        result.append([int(x) for x in split])
-    return result
+    return get_integer_rows(lines)
 
 
 def is_safe_report(report):
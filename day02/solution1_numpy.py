@@ -0,0 +1,52 @@
+import numpy as np
+
+
+def run(lines):
+    return count_safe_reports(lines, 0)
+
+
+def count_safe_reports(lines, max_removed):
+    """Count the reports that are safe once at most max_removed levels are removed from them.
+    Reports of the same length are stacked into one 2D array, so each check is made on every report at once."""
+    lines = list(lines)
+    text = '\n'.join(lines)
+    levels = np.fromstring(text, dtype=np.int64, sep=' ')
+    lengths = count_levels(text, len(lines))
+    starts = np.cumsum(lengths) - lengths
+    result = 0
+    for length in np.flatnonzero(np.bincount(lengths)):
+        rows = starts[lengths == length]
+        # one row per level rather than per report, so each level of every report is contiguous
+        reports = levels[rows + np.arange(length)[:, None]]
+        result += int(find_safe(reports, max_removed).sum())
+    return result
+
+
+def count_levels(text, line_count):
+    """The number of levels on each line: a level starts wherever a character follows a space or a line break."""
+    data = np.frombuffer(text.encode(), dtype=np.uint8)
+    gaps = (data == ord(' ')) | (data == ord('\n'))
+    starts = ~gaps
+    starts[1:] &= gaps[:-1]
+    return np.bincount(np.cumsum(data == ord('\n'))[starts], minlength=line_count)
+
+
+def find_safe(reports, max_removed):
+    """Which columns of a 2D array of reports, one report per column, can be made safe. This is the dynamic
+    programme of day02.solution2.is_safe_report_with_dampener(), with each step taken for all the reports
+    together."""
+    length, count = reports.shape
+    if length <= max_removed + 1:
+        return np.ones(count, dtype=bool)
+    result = np.zeros(count, dtype=bool)
+    for direction in (1, -1):
+        fewest = np.empty((length, count), dtype=np.int64)
+        for j in range(length):
+            best = np.full(count, j)
+            for i in range(max(0, j - max_removed - 1), j):
+                step = direction * (reports[j] - reports[i])
+                np.minimum(best, np.where((step >= 1) & (step <= 3), fewest[i] + j - i - 1, j), out=best)
+            fewest[j] = best
+        # the levels after the last one kept are all removed
+        result |= (fewest + np.arange(length - 1, -1, -1)[:, None]).min(axis=0) <= max_removed
+    return result
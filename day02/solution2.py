@@ -1,21 +1,29 @@
-def run(lines):
+from common.parsing import get_integer_rows
+
+# how many levels the Problem Dampener may remove from a report
+max_removed = 1
+
+
+def run(lines, max_removed=max_removed):
     reports = get_reports(lines)
     result = 0
     for report in reports:
-        if is_safe_report(report) or is_safe_report_with_dampener(report):
+        if is_safe_report(report) or is_safe_report_with_dampener(report, max_removed):
             result += 1
     return result
 
 
+# run() only iterates over the lines once, so it can take them straight from the file
+run_stream = run
+
+
 def get_reports(lines):
-    result = []
-    for line in lines:
-        split = line.split()
-        result.append([int(x) for x in split])
-    return result
+    return get_integer_rows(lines)
 
 
 def is_safe_report(report):
+    if len(report) < 2:
+        return True
     correct_sign = sign(report[1] - report[0])
     for i in range(len(report) - 1):
         difference = report[i+1] - report[i]
@@ -24,18 +32,27 @@ def is_safe_report(report):
     return True
 
 
-def is_safe_report_with_dampener(report):
-    for modified_report in drop_level_from_report(report):
-        if is_safe_report(modified_report):
+def is_safe_report_with_dampener(report, max_removed=max_removed):
+    """Whether removing at most max_removed levels leaves a safe report. For each direction, find the fewest
+    removals that leave a safe report ending at each level. The level kept before it is one of the
+    max_removed + 1 levels just before it, so this takes O(n * max_removed) time rather than trying every
+    copy of the report with levels left out."""
+    if len(report) <= max_removed + 1:
+        # keeping any one level is enough
+        return True
+    for direction in (1, -1):
+        fewest = []
+        for j, level in enumerate(report):
+            # removing every level before this one always works
+            best = j
+            for i in range(max(0, j - max_removed - 1), j):
+                if 1 <= direction * (level - report[i]) <= 3 and fewest[i] + j - i - 1 < best:
+                    best = fewest[i] + j - i - 1
+            fewest.append(best)
+        if min(removed + len(report) - 1 - j for j, removed in enumerate(fewest)) <= max_removed:
             return True
     return False
 
 
-# return copies of the report with one item removed
-def drop_level_from_report(report):
-    for i in range(len(report)):
-        yield [item for idx, item in enumerate(report) if idx != i]
-
-
 def sign(n: int):
     return (n > 0) - (n < 0)
@@ -0,0 +1,6 @@
+from day02.solution1_numpy import count_safe_reports
+from day02.solution2 import max_removed
+
+
+def run(lines, max_removed=max_removed):
+    return count_safe_reports(lines, max_removed)
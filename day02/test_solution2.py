@@ -0,0 +1,37 @@
+from itertools import combinations
+import random
+
+from day02.solution2 import is_safe_report_with_dampener
+
+
+def is_safe_by_brute_force(report, max_removed):
+    for removed in range(max_removed + 1):
+        for dropped in combinations(range(len(report)), removed):
+            kept = [level for i, level in enumerate(report) if i not in dropped]
+            differences = [b - a for a, b in zip(kept, kept[1:])]
+            if all(1 <= d <= 3 for d in differences) or all(-3 <= d <= -1 for d in differences):
+                return True
+    return False
+
+
+def test_dampener_matches_brute_force():
+    rng = random.Random(0)
+    for _ in range(5000):
+        report = [rng.randint(1, 12)]
+        for _ in range(rng.randint(0, 9)):
+            report.append(report[-1] + rng.choice([-4, -2, -1, 0, 1, 2, 3, 3, 4]))
+        report = report[rng.randint(0, 1):]
+        for max_removed in range(4):
+            assert is_safe_report_with_dampener(report, max_removed) == is_safe_by_brute_force(report, max_removed), \
+                (report, max_removed)
+
+
+def test_nothing_removed():
+    assert is_safe_report_with_dampener([7, 6, 4, 2, 1], 0)
+    assert not is_safe_report_with_dampener([1, 3, 2, 4, 5], 0)
+    assert is_safe_report_with_dampener([1, 3, 2, 4, 5], 1)
+
+
+def test_two_removed():
+    assert not is_safe_report_with_dampener([1, 2, 9, 9, 3, 4], 1)
+    assert is_safe_report_with_dampener([1, 2, 9, 9, 3, 4], 2)
@@ -1,3 +1,6 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import os
 import re
 
 pattern = re.compile(r"""
@@ -8,6 +11,11 @@ pattern = re.compile(r"""
                      ([1-9][0-9]{0,2})     # second number
                      \)                    # close parenthesis
                      """, re.X)
+buffer_pattern = re.compile(pattern.pattern.encode(), re.X)
+# mul(999,999)
+longest_instruction = 12
+# the most input a worker reads at once when run in parallel
+range_size = 2**24
 
 
 def run(lines):
@@ -17,6 +25,76 @@ def run(lines):
     return result
 
 
+def run_buffer(buffer):
+    """Scan the whole input at once. No instruction spans a line break, so this finds the same ones as run()."""
+    result = 0
+    for match in buffer_pattern.finditer(buffer):
+        result += int(match.group(1)) * int(match.group(2))
+    return result
+
+
+def run_chunks(chunks):
+    """Scan the input a block at a time, so memory use stays the same however big the input is."""
+    result = 0
+    for match in find_in_chunks(buffer_pattern, chunks, longest_instruction):
+        result += int(match.group(1)) * int(match.group(2))
+    return result
+
+
+def find_in_chunks(pattern, chunks, longest):
+    """Yield the matches of a bytes pattern in a stream of chunks, the same as finditer() would over the chunks
+    joined together, given that no match is more than longest bytes long. A match that starts at least longest
+    bytes before the end of what has been read is settled; the rest, no more than longest - 1 bytes, is carried
+    over to be scanned again with the next chunk."""
+    carry = b''
+    for chunk in chunks:
+        data = carry + chunk
+        settled = len(data) - longest + 1
+        end = 0
+        for match in pattern.finditer(data):
+            if match.start() >= settled:
+                break
+            yield match
+            end = match.end()
+        carry = data[max(settled, end):]
+    yield from pattern.finditer(carry)
+
+
+def run_parallel(path, workers):
+    """Split the input into byte ranges and scan them in a pool of processes."""
+    return sum(map_ranges(sum_range, path, workers))
+
+
+def sum_range(path, start, end):
+    result = 0
+    for match in find_in_range(buffer_pattern, path, start, end):
+        result += int(match.group(1)) * int(match.group(2))
+    return result
+
+
+def map_ranges(function, path, workers):
+    """Call function(path, start, end) on consecutive byte ranges that cover the file, in a pool of processes,
+    and return the results in order."""
+    size = os.path.getsize(path)
+    count = max(workers, -(-size // range_size))
+    bounds = [size * i // count for i in range(count + 1)]
+    with ProcessPoolExecutor(workers) as executor:
+        return list(executor.map(function, repeat(path), bounds[:-1], bounds[1:]))
+
+
+def find_in_range(pattern, path, start, end):
+    """Yield the matches of a bytes pattern that start between start and end in the file. No instruction can start
+    inside another, so a range can be scanned on its own, as long as the matches that start in it are allowed to
+    run on past its end."""
+    with open(path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start + longest_instruction - 1)
+    for match in pattern.finditer(data):
+        if match.start() >= end - start:
+            break
+        yield match
+
+
 def get_number_pairs(lines):
     for line in lines:
         matches = re.finditer(pattern, line)
@@ -1,5 +1,7 @@
 import re
 
+from day03.solution1 import find_in_chunks, find_in_range, longest_instruction, map_ranges
+
 mul_pattern = re.compile(r"""
                      mul                   # multiplication command
                      \(                    # open parenthesis
@@ -13,6 +15,7 @@ do_pattern = re.compile(r"do\(\)")
 dont_pattern = re.compile(r"don't\(\)")
 
 all_patterns = re.compile(f"{mul_pattern.pattern}|{do_pattern.pattern}|{dont_pattern.pattern}", re.X)
+all_buffer_patterns = re.compile(all_patterns.pattern.encode(), re.X)
 
 def run(lines):
     result = 0
@@ -31,6 +34,66 @@ def run(lines):
     return result
 
 
+def run_buffer(buffer):
+    """Scan the whole input at once. No instruction spans a line break, so this finds the same ones as run()."""
+    return add_enabled(all_buffer_patterns.finditer(buffer))
+
+
+def run_chunks(chunks):
+    """Scan the input a block at a time, so memory use stays the same however big the input is. Whether
+    multiplication is enabled carries over from one chunk to the next along with the matches."""
+    return add_enabled(find_in_chunks(all_buffer_patterns, chunks, longest_instruction))
+
+
+def run_parallel(path, workers):
+    """Split the input into byte ranges and scan them in a pool of processes. A range can't know whether
+    multiplication is enabled where it starts, so it reports its total both ways, along with the state it leaves
+    behind if it contains a do() or don't(). Going through the ranges in order then settles which total counts."""
+    return combine_summaries(map_ranges(summarize_range, path, workers))
+
+
+def combine_summaries(summaries):
+    """Add up the summaries of consecutive ranges made by summarize_range(), starting with multiplication
+    enabled."""
+    result = 0
+    multiplication_enabled = True
+    for if_enabled, if_disabled, state in summaries:
+        result += if_enabled if multiplication_enabled else if_disabled
+        if state is not None:
+            multiplication_enabled = state
+    return result
+
+
+def summarize_range(path, start, end):
+    """The total if multiplication is enabled at the start of the range, the total if it isn't, and whether it's
+    enabled at the end, or None if nothing in the range changes it."""
+    if_enabled = if_disabled = 0
+    state = None
+    for match in find_in_range(all_buffer_patterns, path, start, end):
+        if match.group(1) is not None:
+            product = int(match.group(1)) * int(match.group(2))
+            if state is None:
+                if_enabled += product
+            elif state:
+                if_enabled += product
+                if_disabled += product
+        else:
+            state = match.group(0) == b'do()'
+    return if_enabled, if_disabled, state
+
+
+def add_enabled(matches):
+    result = 0
+    multiplication_enabled = True
+    for match in matches:
+        if match.group(1) is not None:
+            if multiplication_enabled:
+                result += int(match.group(1)) * int(match.group(2))
+        else:
+            multiplication_enabled = match.group(0) == b'do()'
+    return result
+
+
 def get_instructions(lines):
     for line in lines:
         for match in re.finditer(all_patterns, line):
@@ -0,0 +1,41 @@
+import random
+
+from day03 import solution1, solution2
+
+# every character that can be part of an instruction, so random inputs are full of near misses
+alphabet = b"mul(,)0123456789do()don't()x\n"
+
+
+def get_inputs():
+    rng = random.Random(0)
+    for _ in range(500):
+        yield bytes(rng.choice(alphabet) for _ in range(rng.randint(0, 80)))
+
+
+def test_chunks_find_what_one_buffer_does():
+    for data in get_inputs():
+        for size in range(1, 21):
+            chunks = [data[i:i + size] for i in range(0, len(data), size)]
+            assert solution1.run_chunks(iter(chunks)) == solution1.run_buffer(data), (data, size)
+            assert solution2.run_chunks(iter(chunks)) == solution2.run_buffer(data), (data, size)
+
+
+def test_ranges_combine_to_what_one_buffer_does(tmp_path):
+    path = tmp_path / 'input.txt'
+    for data in get_inputs():
+        path.write_bytes(data)
+        for size in range(1, 8):
+            bounds = list(range(0, len(data), size)) + [len(data)]
+            ranges = list(zip(bounds, bounds[1:]))
+            assert sum(solution1.sum_range(path, start, end) for start, end in ranges) == solution1.run_buffer(data)
+            summaries = [solution2.summarize_range(path, start, end) for start, end in ranges]
+            assert solution2.combine_summaries(summaries) == solution2.run_buffer(data), (data, size)
+
+
+def test_parallel_splits_into_many_ranges(tmp_path, monkeypatch):
+    path = tmp_path / 'input.txt'
+    data = b''.join(get_inputs())
+    path.write_bytes(data)
+    monkeypatch.setattr(solution1, 'range_size', 64)
+    assert solution1.run_parallel(path, 2) == solution1.run_buffer(data)
+    assert solution2.run_parallel(path, 2) == solution2.run_buffer(data)
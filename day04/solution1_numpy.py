@@ -0,0 +1,17 @@
+from common.numpy_grid import load_grid, window
+
+word = b'XMAS'
+directions = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
+
+
+def run(lines):
+    """Compare the grid with itself shifted by 0 to 3 steps in each direction, all at once."""
+    padding = len(word) - 1
+    grid = load_grid(lines, padding)
+    result = 0
+    for row_step, col_step in directions:
+        matches = window(grid, padding, 0, 0) == word[0]
+        for i in range(1, len(word)):
+            matches &= window(grid, padding, i * row_step, i * col_step) == word[i]
+        result += int(matches.sum())
+    return result
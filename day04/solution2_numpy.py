@@ -0,0 +1,15 @@
+from common.numpy_grid import load_grid, window
+
+M, S = ord('M'), ord('S')
+
+
+def run(lines):
+    grid = load_grid(lines, 1)
+    northeast, southeast = window(grid, 1, -1, 1), window(grid, 1, 1, 1)
+    southwest, northwest = window(grid, 1, 1, -1), window(grid, 1, -1, -1)
+    crosses = (window(grid, 1, 0, 0) == ord('A')) & is_m_and_s(northwest, southeast) & is_m_and_s(northeast, southwest)
+    return int(crosses.sum())
+
+
+def is_m_and_s(a, b):
+    return ((a == M) & (b == S)) | ((a == S) & (b == M))
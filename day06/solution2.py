@@ -1,82 +1,57 @@
-directions = {
-    'N': (-1, 0),
-    'E': (0, 1),
-    'S': (1, 0),
-    'W': (0, -1),
-}
+from common.grid import Grid
+
+OBSTACLE = ord('#')
 
 
 def run(lines):
     result = 0
-    lab, obstacles = get_lab(lines), get_obstacles(lines)
-    position, direction = get_starting_position(lines), 'N'
-    visited = get_visited_positions(lab, obstacles, position, direction)
-    obstacle_candidates = visited.copy()
+    lab = Grid.from_lines(lines)
+    position, direction = get_starting_position(lab), 0
+    obstacle_candidates = get_visited_positions(lab, position, direction)
     obstacle_candidates.remove(position)
     for candidate in obstacle_candidates:
-        new_obstacles = obstacles.copy()
-        new_obstacles.add(candidate)
-        if find_cycle(lab, new_obstacles, position, direction):
+        previous, lab[candidate] = lab[candidate], OBSTACLE
+        if find_cycle(lab, position, direction):
             result += 1
+        lab[candidate] = previous
     return result
 
 
-def get_starting_position(lines):
-    for row, line in enumerate(lines):
-        for col, char in enumerate(line):
-            if char == '^':
-                return row, col
-    raise Exception('No starting position found')
-
-
-def get_lab(lines):
-    result = set()
-    for row, line in enumerate(lines):
-        for col, _ in enumerate(line):
-            result.add((row, col))
-    return result
-
-
-def get_obstacles(lines):
-    result = set()
-    for row, line in enumerate(lines):
-        for col, char in enumerate(line):
-            if char == '#':
-                result.add((row, col))
-    return result
+def get_starting_position(lab: Grid):
+    position = lab.find('^')
+    if position is None:
+        raise Exception('No starting position found')
+    return position
 
 
-def get_visited_positions(lab, obstacles, position, direction):
+def get_visited_positions(lab: Grid, position, direction):
     result = set()
-    while position in lab:
+    while lab[position] != lab.border:
         result.add(position)
-        movement = directions[direction]
-        new_position = (position[0] + movement[0], position[1] + movement[1])
-        if new_position in obstacles:
+        new_position = position + lab.orthogonal[direction]
+        if lab[new_position] == OBSTACLE:
             direction = turn_right(direction)
         else:
             position = new_position
     return result
 
 
-def find_cycle(lab, obstacles, position, direction):
+def find_cycle(lab: Grid, position, direction):
     visited = set()
     while True:
-        visited.add((position, direction))
-        movement = directions[direction]
-        new_position = (position[0] + movement[0], position[1] + movement[1])
-        if new_position not in lab:
+        visited.add(position * 4 + direction)
+        new_position = position + lab.orthogonal[direction]
+        if lab[new_position] == lab.border:
             return False
-        if new_position in obstacles:
+        if lab[new_position] == OBSTACLE:
             direction = turn_right(direction)
         else:
             position = new_position
         # if we've already been in this position traveling in the same direction, we are in a cycle
-        if (position, direction) in visited:
+        if position * 4 + direction in visited:
             return True
 
 
 def turn_right(direction):
-    keys = list(directions.keys())
-    index = keys.index(direction)
-    return keys[(index + 1) % 4]
+    """Directions are indexes into Grid.orthogonal, which runs clockwise from north."""
+    return (direction + 1) % 4
@@ -1,3 +1,6 @@
+from common.parsing import get_integer_rows
+
+
 def run(lines):
     result = 0
     for left_side, right_side in parse_equation(lines):
@@ -6,14 +9,13 @@ def run(lines):
     return result
 
 
+# run() only iterates over the lines once, so it can take them straight from the file
+run_stream = run
+
+
 def parse_equation(lines):
-    for line in lines:
-        split = line.split(': ')
-        left_side = split[0]
-        right_side = split[1].split(' ')
-        left_side = int(left_side)
-        right_side = [int(x) for x in right_side]
-        yield left_side, right_side
+    for row in get_integer_rows(lines):
+        yield row[0], row[1:]
 
 
 def apply_operators(values):
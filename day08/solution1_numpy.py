@@ -0,0 +1,26 @@
+import numpy as np
+
+from day08.solution1 import get_antennas
+
+
+def run(lines):
+    """Every ordered pair of antennas (a, b) with the same frequency has an antinode at 2a - b."""
+    size = len(lines[0])
+    antinodes = []
+    for nodes in get_antennas(lines).values():
+        points = np.array(sorted(nodes))
+        pairs = ~np.eye(len(points), dtype=bool)
+        candidates = (2 * points[:, None, :] - points[None, :, :])[pairs]
+        antinodes.append(candidates[on_map(candidates, size)])
+    return count_distinct(antinodes, size)
+
+
+def on_map(points, size):
+    return ((points >= 0) & (points < size)).all(axis=-1)
+
+
+def count_distinct(antinodes, size):
+    if not antinodes:
+        return 0
+    points = np.concatenate(antinodes)
+    return len(np.unique(points[:, 0] * size + points[:, 1]))
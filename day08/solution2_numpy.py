@@ -0,0 +1,20 @@
+import numpy as np
+
+from day08.solution1_numpy import count_distinct, on_map
+from day08.solution2 import get_antennas
+
+
+def run(lines):
+    """Every ordered pair of antennas (a, b) with the same frequency has antinodes at a + k(a - b) for k >= 0.
+    Each step moves at least one square, so no more than size steps can stay on the map."""
+    size = len(lines[0])
+    steps = np.arange(size + 1)[None, :, None]
+    antinodes = []
+    for nodes in get_antennas(lines).values():
+        points = np.array(sorted(nodes))
+        pairs = ~np.eye(len(points), dtype=bool)
+        differences = (points[:, None, :] - points[None, :, :])[pairs]
+        starts = np.broadcast_to(points[:, None, :], (len(points), len(points), 2))[pairs]
+        candidates = (starts[:, None, :] + steps * differences[:, None, :]).reshape(-1, 2)
+        antinodes.append(candidates[on_map(candidates, size)])
+    return count_distinct(antinodes, size)
@@ -0,0 +1,34 @@
+import numpy as np
+
+from common.numpy_grid import load_grid, orthogonal, window
+
+# the number of trail heads followed at once, one per bit of a uint64
+batch_size = 64
+
+
+def run(lines):
+    """Follow trail heads in batches. Each cell holds a bit set of the trail heads in the batch that can reach it,
+    and each height's bit sets are the union of those of its neighbors one height below."""
+    grid = load_grid(lines, 1)
+    heights = window(grid, 1, 0, 0)
+    heads = np.flatnonzero(heights == ord('0'))
+    result = 0
+    for start in range(0, len(heads), batch_size):
+        batch = heads[start:start + batch_size]
+        reached = np.zeros(grid.shape, dtype=np.uint64)
+        bits = np.zeros(heights.size, dtype=np.uint64)
+        bits[batch] = np.left_shift(np.uint64(1), np.arange(len(batch), dtype=np.uint64))
+        window(reached, 1, 0, 0)[...] = bits.reshape(heights.shape)
+        for height in range(ord('1'), ord('9') + 1):
+            reaching = np.zeros(heights.shape, dtype=np.uint64)
+            for row_step, col_step in orthogonal:
+                reaching |= window(reached, 1, row_step, col_step)
+            reached = np.zeros_like(reached)
+            window(reached, 1, 0, 0)[heights == height] = reaching[heights == height]
+        result += count_bits(reached)
+    return result
+
+
+def count_bits(values):
+    """The number of set bits in all the values together."""
+    return int(np.unpackbits(values.view(np.uint8)).sum())
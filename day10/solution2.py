@@ -1,5 +1,7 @@
 from collections import defaultdict
 
+from common.grid import Grid
+
 
 def run(lines):
     grid = get_grid(lines)
@@ -11,19 +13,12 @@ def run(lines):
 
 
 def get_grid(lines):
-    result = {}
-    for row, line in enumerate(lines):
-        for col, char in enumerate(line):
-            result[(row, col)] = int(char)
-    return result
+    """Heights are stored as their digit characters, which still go up by one from one height to the next."""
+    return Grid.from_lines(lines)
 
 
 def get_trail_heads(grid):
-    result = []
-    for position, height in grid.items():
-        if height == 0:
-            result.append((position,))
-    return result
+    return [(position,) for position in grid.positions('0')]
 
 
 def advance_trails(trails, grid):
@@ -31,18 +26,14 @@ def advance_trails(trails, grid):
     for trail in trails:
         last_position = trail[-1]
         last_height = grid[last_position]
-        for adjacent_position in get_adjacent_positions(last_position):
-            if grid.get(adjacent_position, None) == last_height + 1:
+        for step in grid.orthogonal:
+            adjacent_position = last_position + step
+            if grid[adjacent_position] == last_height + 1:
                 new_trail = trail + (adjacent_position,)
                 result.append(new_trail)
     return result
 
 
-def get_adjacent_positions(position):
-    row, col = position
-    return [(row + 1, col), (row - 1, col), (row, col + 1), (row, col - 1)]
-
-
 def get_ratings(trails):
     temp = defaultdict(set)
     for trail in trails:
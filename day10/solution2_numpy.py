@@ -0,0 +1,17 @@
+import numpy as np
+
+from common.numpy_grid import load_grid, orthogonal, window
+
+
+def run(lines):
+    """Count trails by height instead of following them one at a time: the number of trails reaching a cell is
+    the sum of the trails reaching its neighbors one height below."""
+    grid = load_grid(lines, 1)
+    heights = window(grid, 1, 0, 0)
+    trails = np.zeros(grid.shape, dtype=np.int64)
+    window(trails, 1, 0, 0)[heights == ord('0')] = 1
+    for height in range(ord('1'), ord('9') + 1):
+        reaching = sum(window(trails, 1, row_step, col_step) for row_step, col_step in orthogonal)
+        trails = np.zeros_like(trails)
+        window(trails, 1, 0, 0)[heights == height] = reaching[heights == height]
+    return int(trails.sum())
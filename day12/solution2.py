@@ -1,40 +1,29 @@
 from collections import deque
 
+from common.grid import Grid
+
 
 def run(lines):
     result = 0
-    for region in get_regions(lines):
-        area, edges = get_area(region), count_edges(region)
+    garden = get_garden(lines)
+    for region in get_regions(garden):
+        area, edges = get_area(region), count_edges(garden, region)
         result += (area * edges)
     return result
 
 
-def get_regions(lines):
+def get_regions(garden):
     """Iterate over a garden and return all regions in the garden. This method destroys the garden it operates on."""
-    garden = get_garden(lines)
-    while True:
-        plot = get_any_plot(garden)
-        if plot is None:
-            break
-        region = get_region(garden, plot)
-        erase_region(garden, region)
-        yield region
+    for plot in garden.indexes():
+        if garden[plot] != garden.border:
+            region = get_region(garden, plot)
+            erase_region(garden, region)
+            yield region
 
 
 def get_garden(lines):
-    """Convert the input into a garden. A garden is a dictionary with keys that are plots and values that are plants."""
-    result = {}
-    for row, line in enumerate(lines):
-        for col, plant in enumerate(line):
-            result[(row, col)] = plant
-    return result
-
-
-def get_any_plot(garden):
-    """Return any plot from the garden."""
-    for plot in garden:
-        return plot
-    return None
+    """Convert the input into a garden. A garden is a grid of plants, and a plot is the index of a cell in it."""
+    return Grid.from_lines(lines)
 
 
 def get_region(garden, plot):
@@ -45,22 +34,16 @@ def get_region(garden, plot):
     fifo.append(plot)
     while fifo:
         plot = fifo.pop()
-        if plot not in result and garden.get(plot, None) == plant:
+        if plot not in result and garden[plot] == plant:
             result.add(plot)
-            fifo.extend(get_neighbors(plot))
+            fifo.extend(plot + step for step in garden.orthogonal)
     return result
 
 
-def get_neighbors(plot):
-    """Given a plot, return the plots north, south, east, and west of it."""
-    row, col = plot
-    return [(row - 1, col), (row + 1, col), (row, col + 1), (row, col - 1)]
-
-
 def erase_region(garden, region):
     """Remove all plots in the region from the garden. """
     for plot in region:
-        del garden[plot]
+        garden[plot] = garden.border
 
 
 def get_area(region):
@@ -68,24 +51,26 @@ def get_area(region):
     return len(region)
 
 
-def count_edges(region):
+def count_edges(garden, region):
     """Count the number of edges a region has."""
-    rows = {row for row, _ in region}
-    cols = {col for _, col in region}
+    positions = [garden.position(plot) for plot in region]
+    rows = {row for row, _ in positions}
+    cols = {col for _, col in positions}
     result = 0
     for row in range(min(rows), max(rows) + 2):
-        result += count_edges_by_row(row, cols, region)
+        result += count_edges_by_row(garden, row, cols, region)
     for col in range(min(cols), max(cols) + 2):
-        result += count_edges_by_col(col, rows, region)
+        result += count_edges_by_col(garden, col, rows, region)
     return result
 
 
-def count_edges_by_row(row, cols, region):
+def count_edges_by_row(garden, row, cols, region):
     """Count all edges between the specified row and the row to its north."""
     result = 0
     prior_edge_indicator = (False, False)
     for col in range(min(cols), max(cols) + 1):
-        north, south = (row - 1, col), (row, col)
+        south = garden.index(row, col)
+        north = south - garden.stride
         edge_indicator = (north in region, south in region)
         if is_new_edge(edge_indicator, prior_edge_indicator):
             result += 1
@@ -93,12 +78,13 @@ def count_edges_by_row(row, cols, region):
     return result
 
 
-def count_edges_by_col(col, rows, region):
+def count_edges_by_col(garden, col, rows, region):
     """Count all edges between the specified column and the column to its west."""
     result = 0
     prior_edge_indicator = (False, False)
     for row in range(min(rows), max(rows) + 1):
-        east, west = (row, col), (row, col - 1)
+        east = garden.index(row, col)
+        west = east - 1
         edge_indicator = (east in region, west in region)
         if is_new_edge(edge_indicator, prior_edge_indicator):
             result += 1
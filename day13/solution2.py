@@ -1,7 +1,6 @@
 import math
-import re
 
-integer_pattern = re.compile("[1-9][0-9]*")
+from common.parsing import get_integers
 
 
 def run(lines):
@@ -17,15 +16,13 @@ def run(lines):
 def get_machines(lines):
     """Read the input and extract all machines. A machine consists of two buttons (A and B) and a prize.
     Each button consists of an x-offset and a y-offset. Each prize is a location in an x, y plane. """
-    for idx, line in enumerate(lines):
-        if line.startswith("Button A"):
-            button_a_line = line
-            button_b_line = lines[idx + 1]
-            prize_line = lines[idx + 2]
-            button_a = tuple(int(x) for x in integer_pattern.findall(button_a_line))
-            button_b = tuple(int(x) for x in integer_pattern.findall(button_b_line))
-            prize = tuple(int(x) + 10000000000000 for x in integer_pattern.findall(prize_line))
-            yield button_a, button_b, prize
+    # each machine is described by six integers: two for each button and two for the prize
+    integers = get_integers(lines)
+    for i in range(0, len(integers), 6):
+        a_x, a_y, b_x, b_y, prize_x, prize_y = integers[i:i + 6]
+        button_a, button_b = (a_x, a_y), (b_x, b_y)
+        prize = (prize_x + 10000000000000, prize_y + 10000000000000)
+        yield button_a, button_b, prize
 
 
 def get_button_press_counts(machine):
@@ -1,6 +1,10 @@
 from collections import defaultdict
 import math
-import re
+
+from common.parsing import get_integer_rows
+
+# run() waits for a key press after each step
+interactive = True
 
 
 class Robot:
@@ -21,19 +25,6 @@ class Robot:
         return self._position
 
 
-input_pattern = re.compile(r"""
-                           p=
-                           ([0-9]+)       # x position
-                           ,
-                           ([0-9]+)       # y position
-                           \s
-                           v=
-                           ([-]?[0-9]+)   # x velocity
-                           ,
-                           ([-]?[0-9]+)   # y velocity
-""", re.X)
-
-
 def run(lines):
     room = get_room(lines)
     dividers = get_dividers(room)
@@ -68,11 +59,9 @@ def get_dividers(room) -> tuple[int, int]:
 def get_robots(lines, room) -> list[Robot]:
     """Read the robots from the input file."""
     result = []
-    for line in lines:
-        match = input_pattern.fullmatch(line)
-        initial_position = (int(match.group(1)), int(match.group(2)))
-        velocity = (int(match.group(3)), int(match.group(4)))
-        robot = Robot(initial_position, velocity, room)
+    # each line is p=x,y v=dx,dy
+    for x, y, dx, dy in get_integer_rows(lines):
+        robot = Robot((x, y), (dx, dy), room)
         result.append(robot)
     return result
 
@@ -1,55 +1,4 @@
-from __future__ import annotations
-from dataclasses import dataclass
-
-
-class Node:
-    """A node in a weighted graph. value cannot be changed once set. edges can only be modified through the link() method. distance and visited can be updated as needed to perform Dijkstra's algorithm."""
-
-    def __init__(self, value):
-        self._value = value
-        self._edges: list[Edge] = []
-        self.distance = None
-        self.visited = False
-
-    def __repr__(self):
-        return f'Node(value={self._value}, distance={self.distance}, visited={self.visited})'
-
-    @property
-    def value(self):
-        return self._value
-
-    @property
-    def edges(self) -> list[Edge]:
-        return list(self._edges)
-
-    def link(self, neighbor: Node, cost: int):
-        self._edges.append(Edge(neighbor, cost))
-
-
-@dataclass
-class Edge:
-    """Represents a unidirectional link to a node in a weighted graph."""
-    node: Node
-    weight: int
-
-
-class WeightedGraph:
-    """Nodes are stored in a dictionary keyed by value to make get_node_by_value() fast. """
-
-    def __init__(self, nodes: list[Node]):
-        self._dict = {node.value: node for node in nodes}
-
-    @property
-    def nodes(self) -> list[Node]:
-        return list(self._dict.values())
-
-    def get_node_by_value(self, value) -> Node | None:
-        return self._dict.get(value, None)
-
-    def get_dijkstra_current_node(self) -> Node | None:
-        nodes = [node for node in self._dict.values() if not node.visited and node.distance is not None]
-        return min(nodes, key=lambda node: node.distance, default=None)
-
+from common.graph import WeightedGraph, dijkstra
 
 directions = {
     'N': (-1, 0),
@@ -62,17 +11,24 @@ GRID_SIZE = 70
 
 
 def run(lines):
+    grid_size = get_grid_size(lines)
     points = get_corrupted_points(lines)
     left, right = 0, len(points) - 1
     while left <= right:
         mid = (left + right) // 2
-        if has_exit(points[:mid + 1]):
+        if has_exit(points[:mid + 1], grid_size):
             left = mid + 1
         else:
             right = mid - 1
     return ','.join([str(x) for x in points[mid]])
 
 
+def get_grid_size(lines):
+    """The real input covers 0 to GRID_SIZE in both directions. Generated inputs can cover more,
+    in which case the largest coordinate gives the size."""
+    return max([GRID_SIZE] + [int(x) for line in lines for x in line.split(',')])
+
+
 def get_corrupted_points(lines):
     corrupted_points = []
     for line in lines:
@@ -81,45 +37,34 @@ def get_corrupted_points(lines):
     return corrupted_points
 
 
-def has_exit(corrupted_points):
+def has_exit(corrupted_points, grid_size):
     """Determine if a maze with the provided corrupted points has an exit."""
-    weighted_graph = get_weighted_graph(corrupted_points)
-    current_node = weighted_graph.get_node_by_value((0, 0))
-    current_node.distance = 0
-    while current_node is not None:
-        for edge in current_node.edges:
-            distance = current_node.distance + edge.weight
-            if not edge.node.visited:
-                if edge.node.distance is None or edge.node.distance > distance:
-                    edge.node.distance = distance
-        current_node.visited = True
-        current_node = weighted_graph.get_dijkstra_current_node()
-    return weighted_graph.get_node_by_value((GRID_SIZE, GRID_SIZE)).distance is not None
-
-
-def get_weighted_graph(corrupted_points):
+    weighted_graph = get_weighted_graph(corrupted_points, grid_size)
+    distances = dijkstra(weighted_graph, weighted_graph.get_index((0, 0)))
+    return distances[weighted_graph.get_index((grid_size, grid_size))] is not None
+
+
+def get_weighted_graph(corrupted_points, grid_size):
     """Build a weighted graph representing a maze with all corrupted points marked impassable."""
+    weighted_graph = WeightedGraph()
     # Build nodes
-    nodes = []
-    for point in invert_points(corrupted_points):
-        nodes.append(Node(point))
-    weighted_graph = WeightedGraph(nodes)
+    for point in invert_points(corrupted_points, grid_size):
+        weighted_graph.add_node(point)
     # link nodes
-    for node in weighted_graph.nodes:
-        point = node.value
+    for node, point in enumerate(weighted_graph.values):
         for direction in 'NSEW':
-            neighbor_point = add(point, directions[direction])
-            neighbor = weighted_graph.get_node_by_value(neighbor_point)
+            neighbor = weighted_graph.get_index(add(point, directions[direction]))
             if neighbor is not None:
-                node.link(neighbor, 1)
+                weighted_graph.link(node, neighbor, 1)
     return weighted_graph
 
 
-def invert_points(points):
+def invert_points(points, grid_size):
     """Find all points in the grid not in the provided collection."""
+    points = set(points)
     result = []
-    for x in range(GRID_SIZE + 1):
-        for y in range(GRID_SIZE + 1):
+    for x in range(grid_size + 1):
+        for y in range(grid_size + 1):
             point = (x, y)
             if not point in points:
                 result.append(point)
@@ -1,57 +1,45 @@
-directions = {
-    'N': (-1, 0),
-    'S': (1, 0),
-    'E': (0, 1),
-    'W': (0, -1),
-}
+from common.grid import Grid
+
+WALL = ord('#')
 
 
 def run(lines):
     """For each space on the track, look in all four directions. If you are looking at a wall with a track immediately on the other side, see how much time you would save by hopping over there. The hop takes two seconds, so reduce the savings by that much."""
-    start, _, tracks, walls = read_input(lines)
-    times = assign_times(start, tracks)
+    racetrack, start, _ = read_input(lines, 2)
+    times = assign_times(racetrack, start)
     result = 0
-    for track in tracks:
-        for d in 'NSEW':
-            n1 = add(track, directions[d])
-            n2 = add(n1, directions[d])
-            if n1 in walls and n2 in tracks:
-                time_saved = times[track] - times[n2] - 2
+    for track, time in enumerate(times):
+        if time is None:
+            continue
+        for step in racetrack.orthogonal:
+            n1 = track + step
+            n2 = n1 + step
+            if racetrack[n1] == WALL and times[n2] is not None:
+                time_saved = time - times[n2] - 2
                 if time_saved >= 100:
                     result += 1
     return result
 
 
-def read_input(lines):
-    tracks, walls = set(), set()
-    start, end = None, None
-    for row, line in enumerate(lines):
-        for col, char in enumerate(line):
-            if char == '#':
-                walls.add((row, col))
-            else:
-                tracks.add((row, col))
-            if char == 'S':
-                start = (row, col)
-            if char == 'E':
-                end = (row, col)
-    return start, end, tracks, walls
-
-
-def assign_times(start, tracks):
-    result = {}
+def read_input(lines, padding):
+    """Return the racetrack and where it starts and ends. padding is how far off the edge we may look."""
+    racetrack = Grid.from_lines(lines, padding=padding)
+    return racetrack, racetrack.find('S'), racetrack.find('E')
+
+
+def assign_times(racetrack, start):
+    result = [None] * len(racetrack)
     n, coord = 0, start
-    remaining = set(tracks)
-    while True:
+    while coord is not None:
         result[coord] = n
-        remaining.remove(coord)
         n += 1
-        neighbors = list(remaining & {add(coord, directions[d]) for d in 'NSEW'})
-        if not neighbors:
-            break
-        coord = neighbors[0]
+        coord = get_next_track(racetrack, coord, result)
     return result
 
 
-def add(t1, t2):
-    return (t1[0] + t2[0], t1[1] + t2[1])
+def get_next_track(racetrack, coord, times):
+    for step in racetrack.orthogonal:
+        neighbor = coord + step
+        if racetrack[neighbor] not in (WALL, racetrack.border) and times[neighbor] is None:
+            return neighbor
+    return None
@@ -0,0 +1,27 @@
+import numpy as np
+
+from common.numpy_grid import orthogonal, window
+from day20.solution1 import WALL, assign_times, read_input
+
+padding = 2
+
+
+def run(lines):
+    """Walk the track once, then compare the times of every pair of tracks two apart in each direction at once."""
+    racetrack, start, _ = read_input(lines, padding)
+    times, walls = get_arrays(racetrack, assign_times(racetrack, start))
+    here = window(times, padding, 0, 0)
+    result = 0
+    for row_step, col_step in orthogonal:
+        over = window(times, padding, 2 * row_step, 2 * col_step)
+        cheats = (here >= 0) & window(walls, padding, row_step, col_step) & (over >= 0) & (here - over - 2 >= 100)
+        result += int(cheats.sum())
+    return result
+
+
+def get_arrays(racetrack, times):
+    """The times as a 2D array with -1 off the track, and where the walls are, both padded like racetrack."""
+    shape = (len(racetrack) // racetrack.stride, racetrack.stride)
+    times = np.array([-1 if time is None else time for time in times], dtype=np.int64).reshape(shape)
+    walls = np.frombuffer(racetrack.cells, dtype=np.uint8).reshape(shape) == WALL
+    return times, walls
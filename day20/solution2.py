@@ -1,92 +1,75 @@
-directions = {
-    'N': (-1, 0),
-    'S': (1, 0),
-    'E': (0, 1),
-    'W': (0, -1),
-}
+from common.grid import Grid
+
+WALL = ord('#')
+MAX_CHEAT = 20
 
 
 def run(lines):
-    start, _, tracks, walls = read_input(lines)
-    times = assign_times(start, tracks)
-    cheat_adjustments = get_cheat_adjustments()
+    racetrack, start, _ = read_input(lines, MAX_CHEAT)
+    times = assign_times(racetrack, start)
+    cheat_adjustments = get_cheat_adjustments(racetrack)
     result = 0
-    for track in tracks:
-        cheat_points = get_cheat_points(track, cheat_adjustments, tracks, walls)
-        for cheat_point in cheat_points:
-            distance = calculate_distance(track, cheat_point)
-            time_saved = times[cheat_point] - times[track] - distance
+    for track, time in enumerate(times):
+        if time is None:
+            continue
+        for cheat_point, distance in get_cheat_points(racetrack, track, cheat_adjustments, times):
+            time_saved = times[cheat_point] - time - distance
             if time_saved >= 100:
                 result += 1
     return result
 
 
-def read_input(lines):
-    tracks, walls = set(), set()
-    start, end = None, None
-    for row, line in enumerate(lines):
-        for col, char in enumerate(line):
-            if char == '#':
-                walls.add((row, col))
-            else:
-                tracks.add((row, col))
-            if char == 'S':
-                start = (row, col)
-            if char == 'E':
-                end = (row, col)
-    return start, end, tracks, walls
+def read_input(lines, padding):
+    """Return the racetrack and where it starts and ends. padding is how far off the edge we may look."""
+    racetrack = Grid.from_lines(lines, padding=padding)
+    return racetrack, racetrack.find('S'), racetrack.find('E')
 
 
-def assign_times(start, tracks):
-    """Set the time it takes to reach each track for every track on the racetrack."""
-    result = {}
+def assign_times(racetrack, start):
+    """Set the time it takes to reach each track for every track on the racetrack. Walls get None."""
+    result = [None] * len(racetrack)
     n, coord = 0, start
-    remaining = set(tracks)
-    while True:
+    while coord is not None:
         result[coord] = n
-        remaining.remove(coord)
         n += 1
-        neighbors = list(remaining & {add(coord, directions[d]) for d in 'NSEW'})
-        if not neighbors:
-            break
-        coord = neighbors[0]
+        coord = get_next_track(racetrack, coord, result)
     return result
 
 
-def get_cheat_adjustments():
-    """Calculate the coordinates of all the spaces up to 20 spaces away from (0,0)."""
+def get_next_track(racetrack, coord, times):
+    for step in racetrack.orthogonal:
+        neighbor = coord + step
+        if racetrack[neighbor] not in (WALL, racetrack.border) and times[neighbor] is None:
+            return neighbor
+    return None
+
+
+def get_cheat_adjustments(racetrack):
+    """Calculate the steps to all the spaces from 2 up to MAX_CHEAT spaces away, paired with their distance."""
     result = set()
-    for distance in range(2, 21):
+    for distance in range(2, MAX_CHEAT + 1):
         points = []
         for x in range(distance + 1):
             y = distance - x
             points.append((x, y))
         for x, y in points:
-            result.update([(x, y), (x, -y), (-x, y), (-x, -y)])
+            for row, col in [(x, y), (x, -y), (-x, y), (-x, -y)]:
+                result.add((row * racetrack.stride + col, distance))
     return sorted(result)
 
 
-def get_cheat_points(track, cheat_adjustments, tracks, walls):
-    """For the given track, determine all the cheat points. 
-        A cheat point is any track within 20 spaces of the starting track
+def get_cheat_points(racetrack, track, cheat_adjustments, times):
+    """For the given track, determine all the cheat points and how far away they are.
+        A cheat point is any track within MAX_CHEAT spaces of the starting track
         which is adjacent to a wall on at least one side.
 
         I am confused why walls outside the cheat area count here 
         but I get the wrong answer without them. 
     """
     result = []
-    cheat_area = {add(track, adj) for adj in cheat_adjustments}
-    for candidate in cheat_area & tracks:
-        neighbors = {add(candidate, directions[d]) for d in 'NSEW'} & walls
-        if neighbors:
-            result.append(candidate)
+    for step, distance in cheat_adjustments:
+        candidate = track + step
+        if times[candidate] is not None:
+            if any(racetrack[candidate + s] == WALL for s in racetrack.orthogonal):
+                result.append((candidate, distance))
     return result
-
-
-def add(t1, t2):
-    return (t1[0] + t2[0], t1[1] + t2[1])
-
-
-def calculate_distance(t1, t2):
-    return abs(t1[0] - t2[0]) + abs(t1[1] - t2[1])
-
@@ -0,0 +1,40 @@
+import numpy as np
+
+from common.numpy_grid import orthogonal, window
+from day20.solution1_numpy import get_arrays
+from day20.solution2 import MAX_CHEAT, assign_times, read_input
+
+
+def run(lines):
+    """Walk the track once, then for each cheat (row, col) offset compare the times of every pair of tracks
+    that far apart at once."""
+    racetrack, start, _ = read_input(lines, MAX_CHEAT)
+    times, walls = get_arrays(racetrack, assign_times(racetrack, start))
+    next_to_wall = get_next_to_wall(walls)
+    here = window(times, MAX_CHEAT, 0, 0)
+    result = 0
+    for row_step, col_step, distance in get_cheat_adjustments():
+        there = window(times, MAX_CHEAT, row_step, col_step)
+        cheats = (here >= 0) & (there >= 0) & window(next_to_wall, MAX_CHEAT, row_step, col_step)
+        result += int((cheats & (there - here - distance >= 100)).sum())
+    return result
+
+
+def get_next_to_wall(walls):
+    """Which cells have a wall on at least one side."""
+    result = np.zeros_like(walls)
+    inner = window(result, 1, 0, 0)
+    for row_step, col_step in orthogonal:
+        inner |= window(walls, 1, row_step, col_step)
+    return result
+
+
+def get_cheat_adjustments():
+    """The (row, col) offsets of all the spaces from 2 up to MAX_CHEAT spaces away, with their distance."""
+    result = []
+    for row_step in range(-MAX_CHEAT, MAX_CHEAT + 1):
+        for col_step in range(-MAX_CHEAT, MAX_CHEAT + 1):
+            distance = abs(row_step) + abs(col_step)
+            if 2 <= distance <= MAX_CHEAT:
+                result.append((row_step, col_step, distance))
+    return result
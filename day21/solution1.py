@@ -1,6 +1,8 @@
 from __future__ import annotations
 from collections import defaultdict, deque
 
+from common.graph import WeightedGraph, dijkstra_with_predecessors
+
 reverse_direction_map = {'^': 'v', 'v': '^', '>': '<', '<': '>'}
 
 
@@ -28,17 +30,6 @@ class Node:
         return self._neighbors
 
 
-class NodeState:
-
-    def __init__(self):
-        self.distance: int = None
-        self.visited: bool = False
-        self.previous: list[Node] = []
-
-    def __repr__(self):
-        return f'NodeState(distance={self.distance}, visited={self.visited})'
-
-
 def run(lines) -> int:
     numeric_keypad_rewrite_rules = get_rewrite_rules_for_numeric_keyboard()
     directional_keypad_rewrite_rules = get_rewrite_rules_for_directional_keyboard()
@@ -96,66 +87,41 @@ def get_shortest_paths(nodes: list[Node]) -> dict[tuple[str, str], str]:
     Notice that the inputs are nodes but the outputs are strings because at this point 
     we don't need the nodes anymore. 
     """
+    graph = WeightedGraph()
+    for node in nodes:
+        graph.add_node(node)
+    for index, node in enumerate(nodes):
+        for neighbor in node.get_neighbors().values():
+            graph.link(index, graph.get_index(neighbor), 1)
     result = defaultdict(list)
-    for n1 in nodes:
-        dijkstra_from_n1 = dijkstra(n1, nodes)
-        for n2 in dijkstra_from_n1:
-            for path in represent_shortest_paths_as_strings(n2, dijkstra_from_n1):
+    for start, n1 in enumerate(nodes):
+        distances, predecessors = dijkstra_with_predecessors(graph, start)
+        for end, n2 in enumerate(nodes):
+            if distances[end] is None:
+                continue
+            for path in represent_shortest_paths_as_strings(graph, end, predecessors):
                 result[(n1.value, n2.value)].append(path)
     return result
 
 
-def dijkstra(start_node: Node, all_nodes: list[Node]) -> dict[Node, NodeState]:
-    """Use Dijkstra's algorithm to find the shortest paths from start_node to all nodes in the provided list.
-
-    The result is a dict where the keys are the provided nodes and the values are NodeState objects which
-    indicate the shortest distance from the start_node and paths that attain that shortest distance.
-    """
-
-    def get_next() -> NodeState | None:
-        candidates = [state for state in states_to_nodes if not state.visited and state.distance is not None]
-        if candidates:
-            state = min(candidates, key=lambda x: x.distance)
-            return states_to_nodes[state], state
-        return None, None
-
-    nodes_to_states = {node: NodeState() for node in all_nodes}
-    states_to_nodes = {v: k for k, v in nodes_to_states.items()}
-    current_node, current_state = start_node, nodes_to_states[start_node]
-    current_state.distance = 0
-    while current_node:
-        distance = current_state.distance + 1
-        for neighbor_node in current_node.get_neighbors().values():
-            neighbor_state = nodes_to_states[neighbor_node]
-            if not neighbor_state.visited:
-                if neighbor_state.distance is None or neighbor_state.distance > distance:
-                    neighbor_state.distance = distance
-                    neighbor_state.previous = [current_node]
-                elif neighbor_state.distance == distance:
-                    neighbor_state.previous.append(current_node)
-        current_state.visited = True
-        current_node, current_state = get_next()
-    return nodes_to_states
-
-
-def represent_shortest_paths_as_strings(node: Node, nodes_to_states: dict[Node, NodeState]) -> list[str]:
+def represent_shortest_paths_as_strings(graph: WeightedGraph, end: int, predecessors: list[list[int]]) -> list[str]:
     """Using the information we got from Djikstra's algorithm, reconstruct the shortest paths used to reach the
-    provided node. There is an implied start_node in this function because the data in nodes_to_states came from 
-    running Djikstra's algorithm for a specific start node. But we don't reference that start node explicitly in this
+    provided node. There is an implied start node in this function because predecessors came from running
+    Djikstra's algorithm for a specific start node. But we don't reference that start node explicitly in this
     function because we don't need it.
-    
+
     The strings generated here contain the characters: ^ v < > to indicate direction of movement.
     """
     result = []
-    q = deque([(node, '')])
+    q = deque([(end, '')])
     while q:
-        node, path = q.pop()
-        state = nodes_to_states[node]
-        if not state.previous:
+        index, path = q.pop()
+        if not predecessors[index]:
             result.append(path)
         else:
-            for previous in state.previous:
-                direction = [k for k, v in previous.get_neighbors().items() if v == node][0]
+            node = graph.values[index]
+            for previous in predecessors[index]:
+                direction = [k for k, v in graph.values[previous].get_neighbors().items() if v is node][0]
                 q.append((previous, direction + path))
     return result
 
@@ -32,6 +32,10 @@ def run(lines):
     return result
 
 
+# run() only iterates over the lines once, so it can take them straight from the file
+run_stream = run
+
+
 def get_2000th_secret_number(n: int):
     sng = SecretNumberGenerator(n)
     for _ in range(2000):
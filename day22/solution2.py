@@ -12,6 +12,10 @@ def run(lines):
     return max(totals.values())
 
 
+# run() only iterates over the lines once, so it can take them straight from the file
+run_stream = run
+
+
 def accumulate_sequences(start_value: int):
     """For each sequence we find, store the first price associated with it."""
     result = {}
@@ -1,68 +1,52 @@
 from collections import deque, namedtuple
-import re
 
-
-initial_value_pattern = re.compile(r"""
-                                   ([xy][0-9][0-9])   # register
-                                   :\s
-                                   ([01])             # value
-                                   """, re.X)
-
-gate_pattern = re.compile(r"""
-                               (\w{3})     # input 1
-                               \s
-                               (\w{2,3})   # AND, OR, XOR
-                               \s
-                               (\w{3})     # input 2
-                               \s->\s
-                               (\w{3})     # output
-                               """, re.X)
+from common.instrument import count, span
+from common.parsing import get_input_blocks
 
 Gate = namedtuple('Gate', ['input1', 'action', 'input2', 'output'])
 
 
 def run(lines):
-    registers = {register: None for register in get_all_registers(lines)}
-    for register, value in get_initial_values(lines):
+    return solve(parse(lines))
+
+
+def parse(lines):
+    """The input is a block of initial values followed by a block of gates."""
+    value_lines, gate_lines = get_input_blocks(lines)
+    with span('get gates'):
+        initial_values, gates = get_initial_values(value_lines), get_gates(gate_lines)
+    registers = {register: None for register in get_all_registers(initial_values, gates)}
+    for register, value in initial_values:
         registers[register] = value
-    gates = get_gates(lines)
-    perform_operations(registers, gates)
+    return registers, gates
+
+
+def solve(parsed):
+    registers, gates = parsed
+    with span('perform operations'):
+        perform_operations(registers, gates)
     return convert_to_number(registers)
 
 
-def get_all_registers(lines) -> set[str]:
-    """Read the input and get the names of all the registers."""
-    result = set()
-    for line in lines:
-        if match := initial_value_pattern.fullmatch(line):
-            result.add(match.group(1))
-        elif match := gate_pattern.fullmatch(line):
-            result.add(match.group(1))
-            result.add(match.group(3))
-            result.add(match.group(4))
+def get_all_registers(initial_values: list[tuple[str, bool]], gates: list[Gate]) -> set[str]:
+    """Get the names of all the registers."""
+    result = {register for register, _ in initial_values}
+    for gate in gates:
+        result.update([gate.input1, gate.input2, gate.output])
     return result
 
 
 def get_initial_values(lines) -> list[tuple[str, bool]]:
-    """Return a list of the registers that have initial values and what that value is."""
-    result = []
-    for line in lines:
-        match = initial_value_pattern.fullmatch(line)
-        if match:
-            register = match.group(1)
-            value = match.group(2) == '1'
-            result.append((register, value))
-    return result
+    """Return a list of the registers that have initial values and what that value is. Each line is e.g. x00: 1"""
+    return [(line[:3], line[5] == '1') for line in lines]
 
 
 def get_gates(lines) -> list[Gate]:
-    """Read the gates from the input."""
+    """Read the gates from the input. Each line is e.g. x00 AND y00 -> z00"""
     result = []
     for line in lines:
-        match = gate_pattern.fullmatch(line)
-        if match:
-            operation = Gate(match.group(1), match.group(2), match.group(3), match.group(4))
-            result.append(operation)
+        input1, action, input2, _, output = line.split()
+        result.append(Gate(input1, action, input2, output))
     return result
 
 
@@ -73,13 +57,17 @@ def perform_operations(registers: dict[str, bool], gates: list[Gate]):
     but it was the same speed.
     """
     q = deque(gates)
+    requeues = 0
     while q:
         gate = q.popleft()
         input1, input2 = registers[gate.input1], registers[gate.input2]
         if input1 is None or input2 is None:
             q.append(gate)
+            requeues += 1
         else:
             registers[gate.output] = perform_operation(input1, gate.action, input2)
+    count('gates', len(gates))
+    count('requeues', requeues)
 
 
 def perform_operation(input1: bool, operation: str, input2: bool):
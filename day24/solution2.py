@@ -1,23 +1,22 @@
 from collections import namedtuple
-import re
 
-
-gate_pattern = re.compile(r"""
-                            (\w{3})     # input 1
-                            \s
-                            (\w{2,3})   # AND, OR, XOR
-                            \s
-                            (\w{3})     # input 2
-                            \s->\s
-                            (\w{3})     # output
-                            """, re.X)
+from common.parsing import get_input_blocks
 
 Gate = namedtuple('Gate', ['input1', 'input2', 'action', 'output'])
 
 
 def run(lines):
+    return solve(parse(lines))
+
+
+def parse(lines):
+    # the first block holds the initial values, which aren't needed to find the swaps
+    _, gate_lines = get_input_blocks(lines)
+    return get_gates(gate_lines)
+
+
+def solve(gates):
     """Run until you find four swaps. After finding a swap, update the gates and look for another."""
-    gates = get_gates(lines)
     swaps = []
     while len(swaps) < 4:
         swap = find_next_swap(gates)
@@ -27,13 +26,11 @@ def run(lines):
 
 
 def get_gates(lines) -> list[Gate]:
-    """Read the gates from the input."""
+    """Read the gates from the input. Each line is e.g. x00 AND y00 -> z00"""
     result = []
     for line in lines:
-        match = gate_pattern.fullmatch(line)
-        if match:
-            operation = Gate(match.group(1), match.group(3), match.group(2), match.group(4))
-            result.append(operation)
+        input1, action, input2, _, output = line.split()
+        result.append(Gate(input1, input2, action, output))
     return result
 
 
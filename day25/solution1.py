@@ -1,3 +1,6 @@
+from common.parsing import get_input_blocks
+
+
 def run(lines):
     locks, keys = get_locks_and_keys(lines)
     result = 0
@@ -26,19 +29,6 @@ def get_locks_and_keys(lines):
     return locks, keys
 
 
-def get_input_blocks(lines):
-    """Partition the input by blank rows."""
-    result = []
-    for line in lines:
-        if line == '':
-            yield result
-            result = []
-        else:
-            result.append(line)
-    if result:
-        yield result
-
-
 def overlaps(lock: list[int], key: list[int]):
     """Determine if there's any column were the totals exceed 5."""
     for idx in range(len(lock)):
@@ -1,47 +1,336 @@
 import argparse
-import importlib
-import os
+import sys
 import time
 
+# Only what every command needs is imported up front; the rest is imported by the command that uses it, so that
+# --help and stored answers don't pay for the benchmarking, profiling and multiprocessing machinery.
+from runner import baseline, cache
+from runner.loader import backends, get_input_path, get_module_name, get_solution_path, parse_days
+
 argparser = argparse.ArgumentParser()
-argparser.add_argument('day', type=int)
-argparser.add_argument('solution', type=int)
-argparser.add_argument('input')
+subparsers = argparser.add_subparsers(dest='command')
+
+run_parser = subparsers.add_parser('run', help='run one solution (the default command)')
+run_parser.add_argument('day', type=int)
+run_parser.add_argument('solution', type=int)
+run_parser.add_argument('input')
+profile_group = run_parser.add_mutually_exclusive_group()
+profile_group.add_argument('--profile', action='store_true', help='run under cProfile and write a .prof file')
+profile_group.add_argument('--memory', action='store_true', help='run under tracemalloc')
+profile_group.add_argument('--sample', action='store_true', help='sample the call stack while running')
+profile_group.add_argument('--json', action='store_true',
+                           help='print one line of JSON with the answer, timings, peak memory and Python version')
+run_parser.add_argument('--top', type=int, default=20, help='how many entries the profiling reports show')
+run_parser.add_argument('--interval', type=float, default=0.001, help='seconds between stack samples')
+run_parser.add_argument('--no-cache', dest='cache', action='store_false',
+                        help="always run the solution and its parse() step instead of using stored results")
+run_parser.add_argument('--stream', action='store_true',
+                        help='feed the input lazily to solutions that have run_chunks() or run_stream()')
+run_parser.add_argument('--buffer', action='store_true',
+                        help='give solutions that have run_buffer() the input file mapped into memory')
+run_parser.add_argument('--backend', choices=backends, default='python',
+                        help='use the version of the solution written for this backend, where there is one')
+run_parser.add_argument('--workers', type=int,
+                        help='split the input among this many processes for solutions that have run_parallel()')
+
+bench_parser = subparsers.add_parser('bench', help='time every solution and report JSON')
+bench_parser.add_argument('input')
+bench_parser.add_argument('--days', type=parse_days, help="e.g. '1-25' or '3,5,7-9'")
+bench_parser.add_argument('--runs', type=int, default=10)
+bench_parser.add_argument('--warmup', type=int, default=1)
+bench_parser.add_argument('--output', help='write the JSON report to this file')
+bench_parser.add_argument('--no-cache', dest='cache', action='store_false', help="always run the parse() step")
+bench_parser.add_argument('--stream', action='store_true',
+                          help='feed the input lazily to solutions that have run_chunks() or run_stream()')
+bench_parser.add_argument('--buffer', action='store_true',
+                          help='give solutions that have run_buffer() the input file mapped into memory')
+bench_parser.add_argument('--backend', choices=backends, default='python',
+                          help='use the version of each solution written for this backend, where there is one')
+bench_parser.add_argument('--workers', type=int,
+                          help='split the input among this many processes for solutions that have run_parallel()')
+bench_parser.add_argument('--import-time', action='store_true',
+                          help='also report how long each solution takes to import, measured in a fresh interpreter')
+bench_parser.add_argument('--baseline', default=baseline.default_path, help='file holding the baseline timings')
+bench_parser.add_argument('--save-baseline', action='store_true', help='record this run as the new baseline')
+bench_parser.add_argument('--compare', action='store_true', help='exit non-zero if a solution is slower than its baseline')
+bench_parser.add_argument('--threshold', type=float, default=0.2, help='allowed slowdown over the baseline median')
+bench_parser.add_argument('--min-delta-ms', type=float, default=1.0, help='ignore slowdowns smaller than this')
+
+all_parser = subparsers.add_parser('all', help='run every solution in parallel and print a timing table')
+all_parser.add_argument('input')
+all_parser.add_argument('--days', type=parse_days, help="e.g. '1-25' or '3,5,7-9'")
+all_parser.add_argument('--workers', type=int, help='defaults to the number of cores')
+all_parser.add_argument('--no-cache', dest='cache', action='store_false', help="always run the parse() step")
+
+batch_parser = subparsers.add_parser('batch', help='run one solution on many input files, printing a line of JSON for each')
+batch_parser.add_argument('day', type=int)
+batch_parser.add_argument('solution', type=int)
+batch_parser.add_argument('pattern', help="a glob of input files, quoted so the shell doesn't expand it")
+batch_parser.add_argument('--workers', type=int, help='defaults to the number of cores')
+batch_parser.add_argument('--io-threads', type=int, default=4, help='threads reading input files ahead of the workers')
+
+check_parser = subparsers.add_parser('check', help="run every solution every way it can be run and compare the answers")
+check_parser.add_argument('input')
+check_parser.add_argument('--days', type=parse_days, help="e.g. '1-25' or '3,5,7-9'")
+check_parser.add_argument('--record', action='store_true',
+                          help="save the pure Python answer as the expected one wherever there isn't one yet")
+
+generate_parser = subparsers.add_parser('generate', help='write synthetic inputs, e.g. for bench')
+generate_parser.add_argument('--days', type=parse_days, help="e.g. '1-25' or '3,5,7-9', defaults to every day with a generator")
+generate_parser.add_argument('--scale', type=float, default=1.0, help='1 is roughly the size of a real input')
+generate_parser.add_argument('--seed', type=int, default=0)
+generate_parser.add_argument('--id', help="the input id to write, defaults to 'gen<scale>'")
+
+scaling_parser = subparsers.add_parser('scaling', help='fit how run time grows with generated input size')
+scaling_parser.add_argument('--days', type=parse_days, help="e.g. '1-25' or '3,5,7-9'")
+scaling_parser.add_argument('--scales', type=lambda text: [float(x) for x in text.split(',')], default=[0.25, 0.5, 1.0])
+scaling_parser.add_argument('--seed', type=int, default=0)
+scaling_parser.add_argument('--runs', type=int, default=3, help='the fastest run at each scale is used')
+scaling_parser.add_argument('--expected', type=float, default=1.0, help='the exponent a solution should manage')
+scaling_parser.add_argument('--tolerance', type=float, default=0.25, help='how far over expected is tolerated')
+scaling_parser.add_argument('--csv', help='also write every timing to this file')
+
+serve_parser = subparsers.add_parser('serve', help='keep solutions loaded and answer requests from client.py')
+serve_parser.add_argument('--socket', help='defaults to .cache/daemon.sock')
+
+cache_parser = subparsers.add_parser('cache', help='manage stored answers and parsed inputs')
+cache_parser.add_argument('action', choices=['clear', 'prune'],
+                          help='clear removes everything, prune removes entries unused for --max-age days')
+cache_parser.add_argument('--max-age', type=float, default=cache.default_max_age / 86400)
 
 
 def main():
     init()
-    process()
-    wrapup()
+    if args.command == 'bench':
+        benchmark()
+    elif args.command == 'generate':
+        write_generated_inputs()
+    elif args.command == 'cache':
+        manage_cache()
+    elif args.command == 'serve':
+        from runner import daemon
+        daemon.serve(args.socket or daemon.default_socket_path)
+    elif args.command == 'scaling':
+        report_scaling()
+    elif args.command == 'all':
+        process_all()
+        wrapup()
+    elif args.command == 'batch':
+        process_batch()
+    elif args.command == 'check':
+        check_answers()
+    else:
+        process()
+        wrapup()
 
 
 def init():
     global args
-    args = argparser.parse_args()
+    args = argparser.parse_args(get_argv())
     global start_time
-    start_time = time.time()
+    start_time = time.perf_counter()
+
+
+def get_argv():
+    """The command is optional: `main.py 16 2 x` is short for `main.py run 16 2 x`, and with no arguments at all
+    the usage of run is shown."""
+    argv = sys.argv[1:]
+    if not argv or argv[0] not in subparsers.choices and not argv[0].startswith('-'):
+        argv.insert(0, 'run')
+    return argv
 
 
 def process():
+    profiling_requested = args.profile or args.memory or args.sample
+    # stored answers come from the pure Python solutions, so choosing another backend means running it
+    use_stored = args.cache and not profiling_requested and args.backend == 'python'
+    result_key = (get_module_name(args.day, args.solution), get_solution_path(args.day, args.solution),
+                  get_input_path(args.day, args.input))
+    if use_stored:
+        stored = cache.load_result(*result_key)
+        if stored is not None:
+            answer, seconds = stored
+            if args.json:
+                print_json({'answer': str(answer), 'stored': True, 'solve_ns': int(seconds * 1e9)})
+            else:
+                print(f'Answer: {answer}')
+                print(f'(stored answer, originally took {seconds:.3f} seconds)')
+            return
+    import contextlib
+    from common import instrument
+    from runner import bench, profiling
+    from runner.loader import get_backend, get_solution, is_interactive, prepare_call
+
     solution = get_solution(args.day, args.solution)
-    answer = solution.run(get_input_lines(args.day, args.input))
-    print(f'Answer: {answer}')
+    if args.backend != 'python' and get_backend(solution, args.backend) is None:
+        print(f'No {args.backend} version of this solution is available, running the pure Python one', file=sys.stderr)
+    if args.json:
+        instrument.enable()
+    parse_start = time.perf_counter_ns()
+    function, arguments = prepare_call(solution, args.day, args.input, args.cache, args.stream, args.backend,
+                                       args.buffer, args.workers)
+    solve_start = time.perf_counter_ns()
+    if args.profile:
+        path = f'day{args.day:02d}_solution{args.solution}.prof'
+        answer = profiling.run_with_profile(function, arguments, args.top, path)
+    elif args.memory:
+        answer = profiling.run_with_memory(function, arguments, args.top)
+    elif args.sample:
+        answer = profiling.run_with_sampler(function, arguments, args.top, args.interval)
+    else:
+        # anything the solution prints would get in the way of the JSON
+        with bench.silenced() if args.json else contextlib.nullcontext():
+            answer = function(*arguments)
+    solved = time.perf_counter_ns()
+    if args.json:
+        print_json({'answer': str(answer), 'stored': False, 'parse_ns': solve_start - parse_start,
+                    'solve_ns': solved - solve_start, 'spans': instrument.get_spans(),
+                    'counters': instrument.get_counters()})
+    else:
+        print(f'Answer: {answer}')
+    # interactive solutions print their answer for someone to read, so there's nothing to store
+    if use_stored and not is_interactive(solution) and answer is not None:
+        cache.store_result(*result_key, answer, (solved - parse_start) / 1e9)
+
+
+def print_json(fields):
+    """Print a run's results as a single line, along with what's needed to compare it with other runs."""
+    import json
+    import platform
+    from runner import profiling
+
+    report = {'day': args.day, 'solution': args.solution, 'input': args.input, 'backend': args.backend, **fields,
+              'total_ns': int((time.perf_counter() - start_time) * 1e9), 'peak_rss_bytes': profiling.get_peak_rss(),
+              'python': platform.python_version()}
+    print(json.dumps(report))
+
+
+def benchmark():
+    import json
+    from runner import bench
+
+    results = bench.run_benchmarks(args.input, args.days, args.runs, args.warmup, args.cache, args.stream, args.backend,
+                                   args.buffer, args.import_time, args.workers)
+    report = json.dumps({'input': args.input, 'backend': args.backend, 'workers': args.workers, 'runs': args.runs,
+                         'warmup': args.warmup, 'results': results}, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(report + '\n')
+    else:
+        print(report)
+    if args.compare:
+        check_baseline(results)
+    if args.save_baseline:
+        baseline.save_baseline(args.baseline, args.input, results, get_baseline_variant())
+
+
+def check_baseline(results):
+    stored = baseline.load_baseline(args.baseline, args.input)
+    regressions = baseline.find_regressions(results, stored, args.threshold, args.min_delta_ms * 1_000_000,
+                                            get_baseline_variant())
+    for key, before, after in regressions:
+        print(f'Regression: {key} {before / 1e6:.3f} ms -> {after / 1e6:.3f} ms', file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+
+
+def get_baseline_variant():
+    return baseline.get_variant(args.backend, args.stream, args.buffer, args.workers)
+
+
+def write_generated_inputs():
+    from runner import generate
+
+    input_id = args.id or f'gen{args.scale:g}'
+    days = set(generate.generators) if args.days is None else args.days
+    for path in generate.write_inputs(days, args.scale, args.seed, input_id):
+        print(f'Wrote {path}')
+    print(f"Input id: {input_id}")
+
+
+def report_scaling():
+    import csv
+    from runner import scaling
+
+    results = scaling.measure_scaling(args.days, args.scales, args.seed, args.runs)
+    print(f"{'Day':>3}  {'Solution':>8}  {'Exponent':>8}  {'':>4}" + ''.join(f'  {f"x{x:g} (s)":>10}' for x in args.scales))
+    for item in results:
+        exponent = item['exponent']
+        flag = 'SLOW' if exponent is not None and exponent > args.expected + args.tolerance else ''
+        exponent = '-' if exponent is None else f'{exponent:.2f}'
+        seconds = ''.join(f'  {seconds:>10.4f}' for _, _, seconds in item['points'])
+        print(f"{item['day']:>3}  {item['solution']:>8}  {exponent:>8}  {flag:>4}{seconds}")
+    if args.csv:
+        with open(args.csv, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['day', 'solution', 'scale', 'input_bytes', 'seconds', 'exponent'])
+            for item in results:
+                for scale, size, seconds in item['points']:
+                    writer.writerow([item['day'], item['solution'], scale, size, seconds, item['exponent']])
+
+
+def manage_cache():
+    if args.action == 'clear':
+        cache.clear(cache.results_directory)
+        cache.clear(cache.parsed_directory)
+    else:
+        cache.evict_older_than(cache.results_directory, args.max_age * 86400)
+        cache.evict_older_than(cache.parsed_directory, args.max_age * 86400)
+
+
+def process_all():
+    from runner import parallel
+
+    def report_progress(item):
+        print(f"Finished day {item['day']} solution {item['solution']} in {item['solve_ns'] / 1e9:.3f} seconds",
+              file=sys.stderr)
+    results = parallel.run_all(args.input, args.days, args.workers, report_progress, args.cache)
+    print(f"{'Day':>3}  {'Solution':>8}  {'Seconds':>9}  Answer")
+    for item in results:
+        print(f"{item['day']:>3}  {item['solution']:>8}  {item['solve_ns'] / 1e9:>9.3f}  {item['answer']}")
+
+
+def process_batch():
+    import json
+    from runner import batch
+
+    def report(item):
+        print(json.dumps(item), flush=True)
+    try:
+        results = batch.run_batch(args.day, args.solution, args.pattern, args.workers, args.io_threads, report)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    seconds = time.perf_counter() - start_time
+    print(f'{len(results)} inputs in {seconds:.3f} seconds ({len(results) / seconds:.1f} per second)', file=sys.stderr)
 
 
-def get_solution(day, solution):
-    module_name = f'day{day:02d}.solution{solution}'
-    return importlib.import_module(module_name)
+def check_answers():
+    from runner import answers
 
+    print(f"{'Day':>3}  {'Solution':>8}  {'Path':<12}  {'Seconds':>9}  Answer")
 
-def get_input_lines(day, input_id):
-    file_name = f'input_{input_id}.txt'
-    file_path = os.path.join(f'day{day:02d}', file_name)
-    with open(file_path) as file:
-        return [line.strip() for line in file]
+    def report(item):
+        if not item['correct']:
+            status = 'WRONG' if item['expected'] is None else f"WRONG, expected {item['expected']}"
+        elif not item['recorded']:
+            status = 'recorded' if args.record else 'no recorded answer'
+        else:
+            status = 'ok'
+        print(f"{item['day']:>3}  {item['solution']:>8}  {item['path']:<12}  {item['solve_ns'] / 1e9:>9.3f}  "
+              f"{item['answer']} ({status})", flush=True)
+    results = answers.check_answers(args.input, args.days, args.record, report)
+    wrong = sum(not item['correct'] for item in results)
+    print(f'{len(results)} checked, {wrong} wrong', file=sys.stderr)
+    if wrong:
+        sys.exit(1)
 
 
 def wrapup():
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    if getattr(args, 'json', False):
+        # the JSON already holds the total
+        return
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
 
 
 if __name__ == "__main__":
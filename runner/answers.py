@@ -0,0 +1,86 @@
+import json
+import os
+import time
+
+from runner.bench import silenced
+from runner.loader import (backends, discover_solutions, get_backend, get_input_path, get_solution, is_interactive,
+                           prepare_call)
+
+
+def get_answers_path(day):
+    return os.path.join(f'day{day:02d}', 'answers.json')
+
+
+def load_answers(day):
+    """Return the expected answers recorded for a day, keyed by input id and then by solution."""
+    path = get_answers_path(day)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as file:
+        return json.load(file)
+
+
+def save_answer(day, input_id, solution_number, answer):
+    """Record the expected answer of one solution, keeping those for other inputs and solutions."""
+    stored = load_answers(day)
+    stored.setdefault(input_id, {})[str(solution_number)] = answer
+    with open(get_answers_path(day), 'w') as file:
+        json.dump(stored, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+
+def get_paths(solution):
+    """Every way there is of running a solution, as (name, keyword arguments for prepare_call())."""
+    result = [('python', {'use_cache': False})]
+    if hasattr(solution, 'parse'):
+        result.append(('cached parse', {'use_cache': True}))
+    if hasattr(solution, 'run_chunks') or hasattr(solution, 'run_stream'):
+        result.append(('stream', {'use_cache': False, 'stream': True}))
+    if hasattr(solution, 'run_buffer'):
+        result.append(('buffer', {'use_cache': False, 'buffer': True}))
+    if hasattr(solution, 'run_parallel'):
+        result.append(('parallel', {'use_cache': False, 'workers': 2}))
+    for backend in backends:
+        if backend != 'python' and get_backend(solution, backend) is not None:
+            result.append((backend, {'use_cache': False, 'backend': backend}))
+    return result
+
+
+def check_answers(input_id, days=None, record=False, on_result=None):
+    """Run every solution that has an input file with the given id along every path, timing each one and
+    comparing its answer with the recorded one. Where no answer is recorded, the pure Python path's answer is
+    what the others have to match; with record, that answer is saved as the expected one. A path that raises
+    is never correct, and its error is never recorded."""
+    result = []
+    for day, solution_number in discover_solutions(days):
+        if not os.path.exists(get_input_path(day, input_id)):
+            continue
+        solution = get_solution(day, solution_number)
+        if is_interactive(solution):
+            continue
+        expected = load_answers(day).get(input_id, {}).get(str(solution_number))
+        recorded = expected is not None
+        for path, options in get_paths(solution):
+            answer, failed, solve_ns = run_path(solution, day, input_id, options)
+            if expected is None and path == 'python' and not failed:
+                expected = answer
+                if record:
+                    save_answer(day, input_id, solution_number, answer)
+            item = {'day': day, 'solution': solution_number, 'path': path, 'answer': answer, 'expected': expected,
+                    'recorded': recorded, 'correct': not failed and answer == expected, 'solve_ns': solve_ns}
+            if on_result is not None:
+                on_result(item)
+            result.append(item)
+    return result
+
+
+def run_path(solution, day, input_id, options):
+    """Return the answer, whether the solution raised instead, and the nanoseconds it took."""
+    function, arguments = prepare_call(solution, day, input_id, **options)
+    start = time.perf_counter_ns()
+    try:
+        with silenced():
+            answer, failed = str(function(*arguments)), False
+    except Exception as e:
+        answer, failed = f'{type(e).__name__}: {e}', True
+    return answer, failed, time.perf_counter_ns() - start
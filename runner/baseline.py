@@ -0,0 +1,58 @@
+import json
+import os
+
+default_path = 'bench_baseline.json'
+
+
+def get_variant(backend='python', stream=False, buffer=False, workers=None):
+    """How a benchmark ran the solutions, e.g. 'numpy' or 'stream,workers=4', or '' for the pure Python
+    solutions given their lines, so that timings are only compared with timings taken the same way."""
+    parts = [] if backend == 'python' else [backend]
+    if stream:
+        parts.append('stream')
+    if buffer:
+        parts.append('buffer')
+    if workers:
+        parts.append(f'workers={workers}')
+    return ','.join(parts)
+
+
+def get_key(result, variant=''):
+    key = f"day{result['day']:02d}.solution{result['solution']}"
+    return f'{key}[{variant}]' if variant else key
+
+
+def load_baseline(path, input_id):
+    """Return the median solve times recorded for an input, keyed by solution and the way it was run."""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as file:
+        return json.load(file).get(input_id, {})
+
+
+def save_baseline(path, input_id, results, variant=''):
+    """Record the median solve time of each result, keeping baselines for other inputs."""
+    stored = {}
+    if os.path.exists(path):
+        with open(path) as file:
+            stored = json.load(file)
+    baseline = stored.setdefault(input_id, {})
+    for result in results:
+        baseline[get_key(result, variant)] = result['solve_ns']['median']
+    with open(path, 'w') as file:
+        json.dump(stored, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+
+def find_regressions(results, baseline, threshold, min_delta_ns, variant=''):
+    """A solution has regressed when its median is more than threshold (a fraction) over the baseline.
+    Differences smaller than min_delta_ns are treated as noise."""
+    result = []
+    for item in results:
+        key = get_key(item, variant)
+        if key not in baseline:
+            continue
+        before, after = baseline[key], item['solve_ns']['median']
+        if after > before * (1 + threshold) and after - before >= min_delta_ns:
+            result.append((key, before, after))
+    return result
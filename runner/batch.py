@@ -0,0 +1,76 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import glob
+import os
+import threading
+import time
+
+from runner.bench import silenced
+from runner.loader import get_solution, is_interactive
+from runner.mapped import split_lines
+
+# set in each worker process by _load_solution()
+_solution = None
+
+
+def run_batch(day, solution_number, pattern, workers=None, io_threads=4, on_result=None):
+    """Run one solution on every input file matching a glob pattern, across a pool of processes.
+
+    Each worker imports the solution once and keeps it for all the inputs it's given. Files are read by a
+    small pool of threads in this process, so reading the next inputs overlaps with solving the current ones;
+    no more than two inputs per worker are held in memory at a time. on_result is called with each result
+    as it finishes. Returns the results in the order they finished."""
+    if is_interactive(get_solution(day, solution_number)):
+        raise ValueError(f'day {day} solution {solution_number} is interactive')
+    paths = sorted(glob.glob(pattern))
+    workers = workers or os.cpu_count()
+    in_flight = threading.BoundedSemaphore(2 * workers)
+    results = []
+    lock = threading.Lock()
+
+    def record(item):
+        with lock:
+            results.append(item)
+            if on_result is not None:
+                on_result(item)
+
+    def finish(future, path):
+        in_flight.release()
+        try:
+            record(future.result())
+        except Exception as e:
+            record({'input': path, 'answer': f'{type(e).__name__}: {e}', 'solve_ns': None})
+
+    def read_and_submit(path):
+        in_flight.acquire()
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+        except OSError as e:
+            in_flight.release()
+            record({'input': path, 'answer': f'{type(e).__name__}: {e}', 'solve_ns': None})
+            return
+        executor.submit(solve, path, data).add_done_callback(lambda future: finish(future, path))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_load_solution,
+                             initargs=(day, solution_number)) as executor:
+        with ThreadPoolExecutor(max_workers=io_threads) as readers:
+            for future in [readers.submit(read_and_submit, path) for path in paths]:
+                future.result()
+    return results
+
+
+def _load_solution(day, solution_number):
+    global _solution
+    _solution = get_solution(day, solution_number)
+
+
+def solve(path, data):
+    """Worker side: run the already imported solution on one input."""
+    lines = split_lines(data)
+    start = time.perf_counter_ns()
+    try:
+        with silenced():
+            answer = str(_solution.run(lines))
+    except Exception as e:
+        answer = f'{type(e).__name__}: {e}'
+    return {'input': path, 'answer': answer, 'solve_ns': time.perf_counter_ns() - start}
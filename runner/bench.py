@@ -0,0 +1,90 @@
+import contextlib
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from runner.loader import discover_solutions, get_backend, get_input_path, get_solution, is_interactive, prepare_call
+
+
+def run_benchmarks(input_id, days=None, runs=10, warmup=1, use_cache=True, stream=False, backend='python',
+                   buffer=False, import_time=False, workers=None):
+    """Time every solution that has an input file with the given id. With import_time, also measure how long a
+    fresh interpreter takes to import each solution."""
+    result = []
+    for day, solution_number in discover_solutions(days):
+        if not os.path.exists(get_input_path(day, input_id)):
+            continue
+        solution = get_solution(day, solution_number)
+        if is_interactive(solution):
+            continue
+        print(f'Benchmarking day {day} solution {solution_number}', file=sys.stderr)
+        item = benchmark(day, solution_number, solution, input_id, runs, warmup, use_cache, stream, backend, buffer,
+                         workers)
+        if import_time:
+            module_name = solution.__name__
+            if backend != 'python' and get_backend(solution, backend) is not None:
+                module_name = f'{module_name}_{backend}'
+            item['import_us'] = measure_import(module_name)
+        result.append(item)
+    return result
+
+
+def benchmark(day, solution_number, solution, input_id, runs, warmup, use_cache, stream, backend='python',
+              buffer=False, workers=None):
+    """Time parsing (reading the input and any parse() step) separately from solving."""
+    parse_times, solve_times = [], []
+    for i in range(warmup + runs):
+        # solutions are free to consume or modify their input, so each run prepares a fresh copy
+        start = time.perf_counter_ns()
+        function, arguments = prepare_call(solution, day, input_id, use_cache, stream, backend, buffer, workers)
+        parsed = time.perf_counter_ns()
+        with silenced():
+            answer = function(*arguments)
+        solved = time.perf_counter_ns()
+        if i >= warmup:
+            parse_times.append(parsed - start)
+            solve_times.append(solved - parsed)
+    return {
+        'day': day,
+        'solution': solution_number,
+        'answer': str(answer),
+        'parse_ns': summarize(parse_times),
+        'solve_ns': summarize(solve_times),
+    }
+
+
+def measure_import(module_name):
+    """Microseconds a new interpreter spends importing a module, including everything it imports in turn, as
+    reported by python -X importtime."""
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+                               capture_output=True, text=True, check=True)
+    for line in completed.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == module_name:
+            return int(fields[1])
+    return None
+
+
+def summarize(times):
+    ordered = sorted(times)
+    return {
+        'min': ordered[0],
+        'median': int(statistics.median(ordered)),
+        'p95': percentile(ordered, 95),
+    }
+
+
+def percentile(ordered, p):
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[rank - 1]
+
+
+@contextlib.contextmanager
+def silenced():
+    """Some solutions print as they go; keep that out of the benchmark report."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
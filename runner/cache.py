@@ -0,0 +1,102 @@
+import hashlib
+import os
+import pickle
+import time
+
+parsed_directory = os.path.join('.cache', 'parsed')
+results_directory = os.path.join('.cache', 'results')
+default_max_bytes = 256 * 2**20
+default_max_age = 30 * 24 * 60 * 60
+
+
+def get_key(*parts: bytes):
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(hashlib.sha256(part).digest())
+    return digest.hexdigest()
+
+
+def get_source_key(module_name, source_path, input_path):
+    """A key that changes whenever the source of the solution's day, which it may import from, the shared code
+    in common/ or the input changes."""
+    parts = [module_name.encode()]
+    for path in get_sources(os.path.dirname(source_path)) + get_sources('common') + [input_path]:
+        with open(path, 'rb') as file:
+            parts.append(file.read())
+    return get_key(*parts)
+
+
+def get_sources(directory):
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.py'))
+
+
+def load(directory, key):
+    """Return (True, value) on a hit and (False, None) on a miss. A hit marks the entry as recently used."""
+    path = os.path.join(directory, key)
+    try:
+        with open(path, 'rb') as file:
+            value = pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return False, None
+    os.utime(path)
+    return True, value
+
+
+def store(directory, key, value, max_bytes=default_max_bytes):
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, key)
+    temporary_path = f'{path}.{os.getpid()}.tmp'
+    with open(temporary_path, 'wb') as file:
+        pickle.dump(value, file, pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_path, path)
+    evict(directory, max_bytes)
+
+
+def evict_older_than(directory, max_age):
+    """Remove entries that haven't been used for max_age seconds."""
+    if not os.path.isdir(directory):
+        return
+    cutoff = time.time() - max_age
+    for entry in os.scandir(directory):
+        if entry.is_file() and entry.stat().st_mtime < cutoff:
+            os.remove(entry.path)
+
+
+def clear(directory):
+    import shutil
+
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def evict(directory, max_bytes):
+    """Remove the least recently used entries until the directory fits in max_bytes."""
+    entries = [entry for entry in os.scandir(directory) if entry.is_file() and not entry.name.endswith('.tmp')]
+    entries.sort(key=lambda entry: entry.stat().st_mtime)
+    total = sum(entry.stat().st_size for entry in entries)
+    for entry in entries:
+        if total <= max_bytes:
+            break
+        total -= entry.stat().st_size
+        os.remove(entry.path)
+
+
+def parse_with_cache(solution, input_path, read_lines):
+    """Call the solution's parse() step, reusing an earlier result for the same source and input."""
+    key = get_source_key(solution.__name__, solution.__file__, input_path)
+    found, parsed = load(parsed_directory, key)
+    if not found:
+        parsed = solution.parse(read_lines())
+        store(parsed_directory, key, parsed)
+    return parsed
+
+
+def load_result(module_name, source_path, input_path):
+    """Return the stored answer and the seconds it originally took, or None if there isn't one."""
+    found, value = load(results_directory, get_source_key(module_name, source_path, input_path))
+    return value if found else None
+
+
+def store_result(module_name, source_path, input_path, answer, seconds):
+    key = get_source_key(module_name, source_path, input_path)
+    store(results_directory, key, (answer, seconds))
+    evict_older_than(results_directory, default_max_age)
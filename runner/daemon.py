@@ -0,0 +1,70 @@
+"""A long running process that keeps solution modules imported and answers requests over a Unix socket.
+Each request and each response is a single line of JSON."""
+import json
+import os
+import socket
+
+default_socket_path = os.path.join('.cache', 'daemon.sock')
+
+
+def serve(socket_path=default_socket_path):
+    # imported here so that clients, which share this module, don't pay for it
+    import socketserver
+
+    class RequestHandler(socketserver.StreamRequestHandler):
+
+        def handle(self):
+            request = json.loads(self.rfile.readline())
+            try:
+                response = solve(request['day'], request['solution'], request['input'], request.get('cache', True))
+            except Exception as e:
+                response = {'error': f'{type(e).__name__}: {e}'}
+            self.wfile.write(json.dumps(response).encode() + b'\n')
+
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    os.makedirs(os.path.dirname(socket_path) or '.', exist_ok=True)
+    with socketserver.UnixStreamServer(socket_path, RequestHandler) as server:
+        print(f'Listening on {socket_path}')
+        try:
+            server.serve_forever()
+        finally:
+            os.remove(socket_path)
+
+
+def solve(day, solution_number, input_id, use_cache):
+    # imported here so that clients, which share this module, don't pay for them
+    import sys
+    import time
+    from runner.bench import silenced
+    from runner.cache import get_sources
+    from runner.loader import get_solution, prepare_call
+
+    start = time.perf_counter()
+    solution = get_solution(day, solution_number)
+    loaded_at = getattr(solution, '_loaded_at', None)
+    sources = get_sources(os.path.dirname(solution.__file__))
+    if loaded_at is not None and max(map(os.path.getmtime, sources)) > loaded_at:
+        # the day's source has been edited since it was imported. Forget every module of the day, so that the
+        # ones the solution imports from are loaded again too
+        package = solution.__name__.rpartition('.')[0]
+        for name in [name for name in sys.modules if name.startswith(f'{package}.')]:
+            del sys.modules[name]
+        solution = get_solution(day, solution_number)
+        loaded_at = None
+    if loaded_at is None:
+        solution._loaded_at = time.time()
+    function, arguments = prepare_call(solution, day, input_id, use_cache)
+    with silenced():
+        answer = function(*arguments)
+    return {'answer': str(answer), 'seconds': time.perf_counter() - start}
+
+
+def request(day, solution, input_id, use_cache=True, socket_path=default_socket_path):
+    """Send a request to a running daemon. Raises OSError if there isn't one."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        message = {'day': day, 'solution': solution, 'input': input_id, 'cache': use_cache}
+        connection.sendall(json.dumps(message).encode() + b'\n')
+        with connection.makefile('rb') as file:
+            return json.loads(file.readline())
@@ -0,0 +1,452 @@
+"""Synthetic puzzle inputs. Each generate_dayNN(scale, rng) returns the lines of a valid input
+for that day, with scale multiplying whatever makes the puzzle big: the side of the grid for
+the grid puzzles and the number of records for the others. A scale of 1 is roughly the size
+of a real input."""
+from collections import deque
+import itertools
+import os
+import random
+import string
+
+from runner.loader import get_input_path
+
+
+def write_inputs(days, scale, seed, input_id):
+    """Generate an input for each day and save it as dayNN/input_<input_id>.txt."""
+    result = []
+    for day in sorted(days):
+        rng = random.Random(f'{seed}-{day}')
+        lines = generators[day](scale, rng)
+        path = get_input_path(day, input_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as file:
+            file.write('\n'.join(lines) + '\n')
+        result.append(path)
+    return result
+
+
+def get_size(base, scale, minimum=1):
+    return max(minimum, round(base * scale))
+
+
+def generate_day01(scale, rng):
+    """Two columns of location ids. About half the right column repeats ids from the left."""
+    left = [rng.randint(10000, 99999) for _ in range(get_size(1000, scale))]
+    right = [rng.choice(left) if rng.random() < 0.5 else rng.randint(10000, 99999) for _ in left]
+    return [f'{a}   {b}' for a, b in zip(left, right)]
+
+
+def generate_day02(scale, rng):
+    """Reports that start out safe, half of which then have one level nudged."""
+    result = []
+    for _ in range(get_size(1000, scale)):
+        sign = rng.choice([1, -1])
+        report = [rng.randint(1, 60) if sign > 0 else rng.randint(30, 90)]
+        for _ in range(rng.randint(4, 7)):
+            report.append(report[-1] + sign * rng.randint(1, 3))
+        if rng.random() < 0.5:
+            report[rng.randrange(len(report))] += rng.randint(-3, 3)
+        result.append(' '.join(str(x) for x in report))
+    return result
+
+
+def generate_day03(scale, rng):
+    """Lines of corrupted memory with real instructions mixed in among near misses."""
+    noise = "!@#$%^&*()[]{}<>+-_,.;:'/?~ wherehowselectfromwhymul"
+    result = []
+    for _ in range(get_size(6, scale)):
+        parts, length = [], 0
+        while length < 3000:
+            choice = rng.random()
+            if choice < 0.15:
+                part = f'mul({rng.randint(1, 999)},{rng.randint(1, 999)})'
+            elif choice < 0.2:
+                part = rng.choice(['do()', "don't()"])
+            elif choice < 0.3:
+                part = rng.choice([f'mul({rng.randint(1, 999)} ,{rng.randint(1, 999)})',
+                                   f'mul[{rng.randint(1, 999)},{rng.randint(1, 999)}]',
+                                   f'mul({rng.randint(1, 999)},{rng.randint(1, 999)}',
+                                   "don't", 'do(', 'mul(0,5)'])
+            else:
+                part = ''.join(rng.choice(noise) for _ in range(rng.randint(1, 8)))
+            parts.append(part)
+            length += len(part)
+        result.append(''.join(parts))
+    return result
+
+
+def generate_day04(scale, rng):
+    size = get_size(140, scale, 4)
+    return [''.join(rng.choice('XMAS') for _ in range(size)) for _ in range(size)]
+
+
+def generate_day05(scale, rng):
+    """Rules ordering every pair of 49 pages, then updates of which about half are already in order."""
+    pages = rng.sample([10 * a + b for a in range(1, 10) for b in range(1, 10)], 49)
+    rules = [f'{pages[i]}|{pages[j]}' for i in range(len(pages)) for j in range(i + 1, len(pages))]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(get_size(200, scale)):
+        update = rng.sample(pages, rng.choice(range(5, 24, 2)))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(','.join(str(x) for x in update))
+    return rules + [''] + updates
+
+
+def generate_day06(scale, rng):
+    """A lab whose obstacles turn the guard onto an inward spiral with uneven gaps between its rings, so its walk
+    covers a fixed share of the lab whatever the size, with more obstacles scattered where the walk doesn't go.
+    Layouts where the guard, once out of the spiral, ends up in a loop are thrown away."""
+    size = get_size(130, scale, 10)
+    while True:
+        grid = [['.'] * size for _ in range(size)]
+        start, walk = lay_spiral(grid, rng)
+        for row in range(size):
+            for col in range(size):
+                if (row, col) not in walk and grid[row][col] == '.' and rng.random() < 0.03:
+                    grid[row][col] = '#'
+        grid[start[0]][start[1]] = '^'
+        if guard_leaves(grid, start):
+            return [''.join(row) for row in grid]
+
+
+def lay_spiral(grid, rng):
+    """Put obstacles just past the corners of a clockwise spiral, starting at its bottom left corner facing up.
+    After each side the spiral moves in by 2 to 6 cells on that side. Returns the start and the cells walked."""
+    size = len(grid)
+    top, left, bottom, right = (rng.randint(1, 3) for _ in range(4))
+    bottom, right = size - 1 - bottom, size - 1 - right
+    row, col = start = (bottom, left)
+    walk = {start}
+    for side in itertools.cycle(range(4)):
+        if bottom - top < 2 or right - left < 2:
+            return start, walk
+        d_row, d_col = [(-1, 0), (0, 1), (1, 0), (0, -1)][side]
+        target = [top, right, bottom, left][side]
+        while (row, col)[side % 2 == 1] != target:
+            row, col = row + d_row, col + d_col
+            walk.add((row, col))
+        grid[row + d_row][col + d_col] = '#'
+        gap = rng.randint(2, 6)
+        if side == 0:
+            left += gap
+        elif side == 1:
+            top += gap
+        elif side == 2:
+            right -= gap
+        else:
+            bottom -= gap
+
+
+def guard_leaves(grid, start):
+    size = len(grid)
+    (row, col), (d_row, d_col) = start, (-1, 0)
+    seen = set()
+    while 0 <= row < size and 0 <= col < size:
+        state = (row, col, d_row, d_col)
+        if state in seen:
+            return False
+        seen.add(state)
+        next_row, next_col = row + d_row, col + d_col
+        if 0 <= next_row < size and 0 <= next_col < size and grid[next_row][next_col] == '#':
+            d_row, d_col = d_col, -d_row
+        else:
+            row, col = next_row, next_col
+    return True
+
+
+def generate_day07(scale, rng):
+    """Equations, half of which can be made true with +, * and ||."""
+    result = []
+    for _ in range(get_size(850, scale)):
+        values = [rng.randint(1, 99) for _ in range(rng.randint(3, 12))]
+        if rng.random() < 0.5:
+            total = values[0]
+            for value in values[1:]:
+                operator = rng.choice('+*|')
+                total = total + value if operator == '+' else total * value if operator == '*' else int(f'{total}{value}')
+        else:
+            total = rng.randint(1, 10 ** rng.randint(3, 12))
+        result.append(f"{total}: {' '.join(str(x) for x in values)}")
+    return result
+
+
+def generate_day08(scale, rng):
+    size = get_size(50, scale, 4)
+    grid = [['.'] * size for _ in range(size)]
+    frequencies = string.ascii_letters + string.digits
+    for _ in range(get_size(200, scale * scale)):
+        grid[rng.randrange(size)][rng.randrange(size)] = rng.choice(frequencies)
+    return [''.join(row) for row in grid]
+
+
+def generate_day09(scale, rng):
+    """A disk map that starts and ends with a file."""
+    length = get_size(10000, scale) * 2 - 1
+    return [''.join(str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9)) for i in range(length))]
+
+
+def generate_day10(scale, rng):
+    """Heights climb diagonally so there are plenty of trails, with a quarter of the cells scrambled."""
+    size = get_size(45, scale, 4)
+    return [''.join(str(rng.randint(0, 9) if rng.random() < 0.25 else (row + col) % 10) for col in range(size))
+            for row in range(size)]
+
+
+def generate_day11(scale, rng):
+    return [' '.join(str(rng.randint(0, 9999999)) for _ in range(get_size(8, scale)))]
+
+
+def generate_day12(scale, rng):
+    """Roughly 10x10 regions with ragged edges."""
+    size = get_size(140, scale, 4)
+    blocks = size // 10 + 2
+    letters = [[rng.choice(string.ascii_uppercase) for _ in range(blocks)] for _ in range(blocks)]
+    return [''.join(letters[(row + rng.randint(0, 2)) // 10][(col + rng.randint(0, 2)) // 10] for col in range(size))
+            for row in range(size)]
+
+
+def generate_day13(scale, rng):
+    """Claw machines, half of which have a prize that can be reached in at most 100 presses of each button.
+    One button moves further in X and the other further in Y, so the far away prizes of part 2 are
+    never reached with a negative number of presses."""
+    result = []
+    for _ in range(get_size(320, scale)):
+        a, b = (rng.randint(50, 99), rng.randint(10, 49)), (rng.randint(10, 49), rng.randint(50, 99))
+        if rng.random() < 0.5:
+            a, b = b, a
+        if rng.random() < 0.5:
+            a_presses, b_presses = rng.randint(1, 100), rng.randint(1, 100)
+            prize = (a[0] * a_presses + b[0] * b_presses, a[1] * a_presses + b[1] * b_presses)
+        else:
+            prize = (rng.randint(1000, 20000), rng.randint(1000, 20000))
+        result.extend([f'Button A: X+{a[0]}, Y+{a[1]}', f'Button B: X+{b[0]}, Y+{b[1]}',
+                       f'Prize: X={prize[0]}, Y={prize[1]}', ''])
+    return result[:-1]
+
+
+def generate_day14(scale, rng):
+    """Robots in the full-size 101x103 room; there need to be more than 20 for the solution to use it."""
+    return [f'p={rng.randrange(101)},{rng.randrange(103)} v={rng.randint(-99, 99)},{rng.randint(-99, 99)}'
+            for _ in range(get_size(500, scale, 21))]
+
+
+def generate_day15(scale, rng):
+    size = get_size(50, scale, 5)
+    grid = [['#'] * size] + [['#'] + ['.'] * (size - 2) + ['#'] for _ in range(size - 2)] + [['#'] * size]
+    for row in range(1, size - 1):
+        for col in range(1, size - 1):
+            choice = rng.random()
+            grid[row][col] = '#' if choice < 0.1 else 'O' if choice < 0.4 else '.'
+    grid[size // 2][size // 2] = '@'
+    moves = [''.join(rng.choice('^v<>') for _ in range(1000)) for _ in range(get_size(20, scale))]
+    return [''.join(row) for row in grid] + [''] + moves
+
+
+def generate_day16(scale, rng):
+    """A maze carved by a randomised depth first search, with some extra walls knocked out to create loops.
+    The start is in the bottom left corner and the end is in the top right."""
+    size = get_size(141, scale, 5) // 2 * 2 + 1
+    grid = carve_maze(size, rng)
+    for _ in range(size * size // 50):
+        row, col = rng.randrange(1, size - 1), rng.randrange(1, size - 1)
+        if (row + col) % 2 == 1:
+            grid[row][col] = '.'
+    grid[size - 2][1], grid[1][size - 2] = 'S', 'E'
+    return [''.join(row) for row in grid]
+
+
+def carve_maze(size, rng):
+    grid = [['#'] * size for _ in range(size)]
+    grid[1][1] = '.'
+    stack = [(1, 1)]
+    while stack:
+        row, col = stack[-1]
+        neighbors = [(row + d_row, col + d_col) for d_row, d_col in [(-2, 0), (2, 0), (0, -2), (0, 2)]
+                     if 0 < row + d_row < size - 1 and 0 < col + d_col < size - 1 and grid[row + d_row][col + d_col] == '#']
+        if not neighbors:
+            stack.pop()
+            continue
+        next_row, next_col = rng.choice(neighbors)
+        grid[(row + next_row) // 2][(col + next_col) // 2] = '.'
+        grid[next_row][next_col] = '.'
+        stack.append((next_row, next_col))
+    return grid
+
+
+def generate_day17(scale, rng):
+    """The puzzle's program shape (one output per 3 bits of A) with random constants, chosen so that
+    part 2 has an answer. Scale sets how many digits part 1 prints."""
+    while True:
+        x, y = rng.randrange(8), rng.randrange(8)
+        program = [2, 4, 1, x, 7, 5, 1, y, 4, rng.randrange(8), 0, 3, 5, 5, 3, 0]
+        if has_quine(x, y, program):
+            break
+    digits = get_size(16, scale)
+    a = rng.randrange(8 ** (digits - 1), 8 ** digits)
+    return [f'Register A: {a}', 'Register B: 0', 'Register C: 0', '', f"Program: {','.join(str(n) for n in program)}"]
+
+
+def has_quine(x, y, program):
+    """Can A be chosen so the program prints itself? Builds A three bits at a time from the last output."""
+    candidates = [0]
+    for digit in reversed(program):
+        candidates = [a for parent in candidates for a in range(parent * 8, parent * 8 + 8)
+                      if first_output(a, x, y) == digit]
+    return len(candidates) > 0
+
+
+def first_output(a, x, y):
+    b = (a % 8) ^ x
+    return (b ^ y ^ (a >> b)) % 8
+
+
+def generate_day18(scale, rng):
+    """Falling bytes on a grid. The path stays open for the bytes part 1 reads and is cut off by the end.
+    The grid size is implied by the largest coordinate, so it can't be smaller than the real one."""
+    side = get_size(71, scale, 71)
+    bytes_to_read = 1024 * side * side // (71 * 71)
+    points = [(x, y) for x in range(side) for y in range(side) if (x, y) not in {(0, 0), (side - 1, side - 1)}]
+    count = min(len(points), 3450 * side * side // (71 * 71))
+    while True:
+        chosen = rng.sample(points, count)
+        if max(max(point) for point in chosen) != side - 1:
+            continue
+        if has_path(side, chosen[:bytes_to_read]) and not has_path(side, chosen):
+            return [f'{x},{y}' for x, y in chosen]
+
+
+def has_path(side, corrupted):
+    corrupted = set(corrupted)
+    seen, queue = {(0, 0)}, deque([(0, 0)])
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) == (side - 1, side - 1):
+            return True
+        for neighbor in [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]:
+            if 0 <= neighbor[0] < side and 0 <= neighbor[1] < side and neighbor not in corrupted and neighbor not in seen:
+                seen.add(neighbor)
+                queue.append(neighbor)
+    return False
+
+
+def generate_day19(scale, rng):
+    """There's no single-stripe red towel, so designs that aren't built from towels are often impossible."""
+    patterns = set('wubg')
+    while len(patterns) < 450:
+        patterns.add(''.join(rng.choice('wubrg') for _ in range(rng.randint(2, 8))))
+    patterns = sorted(patterns)
+    designs = []
+    for _ in range(get_size(400, scale)):
+        if rng.random() < 0.5:
+            design = ''
+            while len(design) < 40:
+                design += rng.choice(patterns)
+        else:
+            design = ''.join(rng.choice('wubrg') for _ in range(rng.randint(40, 60)))
+        designs.append(design)
+    return [', '.join(patterns), ''] + designs
+
+
+def generate_day20(scale, rng):
+    """A single track that snakes back and forth, so every row of wall between two stretches is worth cheating through."""
+    size = get_size(141, scale, 7) // 2 * 2 + 1
+    grid = [['#'] * size for _ in range(size)]
+    for row in range(1, size - 1, 2):
+        for col in range(1, size - 1):
+            grid[row][col] = '.'
+        if row + 2 < size - 1:
+            grid[row + 1][size - 2 if row % 4 == 1 else 1] = '.'
+    last_row = size - 2
+    grid[1][1] = 'S'
+    grid[last_row][size - 2 if last_row % 4 == 1 else 1] = 'E'
+    return [''.join(row) for row in grid]
+
+
+def generate_day21(scale, rng):
+    return [f'{rng.randint(0, 999):03d}A' for _ in range(get_size(5, scale))]
+
+
+def generate_day22(scale, rng):
+    return [str(rng.randint(1, 16777215)) for _ in range(get_size(2400, scale))]
+
+
+def generate_day23(scale, rng):
+    """A sparse network where each computer has about 13 connections, plus one hidden 13 computer party."""
+    count = get_size(520, scale, 13)
+    length = 2 if count <= 26 * 26 else 3
+    names = set()
+    while len(names) < count:
+        names.add(''.join(rng.choice(string.ascii_lowercase) for _ in range(length)))
+    names = sorted(names)
+    edges = set()
+    for name in names:
+        for other in rng.sample(names, 6):
+            if other != name:
+                edges.add(tuple(sorted((name, other))))
+    party = rng.sample(names, 13)
+    edges.update(tuple(sorted((a, b))) for a in party for b in party if a < b)
+    result = [f'{a}-{b}' if rng.random() < 0.5 else f'{b}-{a}' for a, b in sorted(edges)]
+    result.sort()
+    rng.shuffle(result)
+    return result
+
+
+def generate_day24(scale, rng):
+    """A ripple carry adder with the outputs of four pairs of gates swapped, in four separate bits.
+    Register names have two digits, so there are at most 99 bits."""
+    bits = min(99, get_size(45, scale, 10))
+    names = set()
+    while len(names) < 5 * bits:
+        name = ''.join(rng.choice(string.ascii_lowercase) for _ in range(3))
+        if name[0] not in 'xyz':
+            names.add(name)
+    names = iter(sorted(names))
+    gates = [['x00', 'XOR', 'y00', 'z00'], ['x00', 'AND', 'y00', next(names)]]
+    carry, by_bit = gates[-1][3], {}
+    for n in range(1, bits):
+        x, y, z = f'x{n:02}', f'y{n:02}', f'z{n:02}'
+        add, carry_in, add_carry, plain_carry = next(names), carry, next(names), next(names)
+        carry = f'z{bits:02}' if n == bits - 1 else next(names)
+        by_bit[n] = {
+            'add': [x, 'XOR', y, add],
+            'sum': [carry_in, 'XOR', add, z],
+            'add_carry': [carry_in, 'AND', add, add_carry],
+            'plain_carry': [x, 'AND', y, plain_carry],
+            'carry': [add_carry, 'OR', plain_carry, carry],
+        }
+        gates.extend(by_bit[n].values())
+    # the solution can only untangle one bit at a time, so keep the swapped bits apart
+    swapped_bits = rng.sample(range(1, bits - 1), 4)
+    while any(abs(a - b) < 2 for a in swapped_bits for b in swapped_bits if a != b):
+        swapped_bits = rng.sample(range(1, bits - 1), 4)
+    for n in swapped_bits:
+        first, second = rng.choice([('add', 'plain_carry'), ('sum', 'add_carry'), ('sum', 'carry')])
+        first, second = by_bit[n][first], by_bit[n][second]
+        first[3], second[3] = second[3], first[3]
+    rng.shuffle(gates)
+    initial_values = [f'{register}{n:02}: {rng.randint(0, 1)}' for register in 'xy' for n in range(bits)]
+    return initial_values + [''] + [f'{a} {action} {b} -> {output}' for a, action, b, output in gates]
+
+
+def generate_day25(scale, rng):
+    """Locks and keys, seven rows of five pin columns each."""
+    result = []
+    for _ in range(get_size(500, scale)):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        if rng.random() < 0.5:
+            rows = [''.join('#' if row <= height else '.' for height in heights) for row in range(7)]
+        else:
+            rows = [''.join('#' if row >= 6 - height else '.' for height in heights) for row in range(7)]
+        result.extend(rows + [''])
+    return result[:-1]
+
+
+generators = {
+    1: generate_day01, 2: generate_day02, 3: generate_day03, 4: generate_day04, 5: generate_day05,
+    6: generate_day06, 7: generate_day07, 8: generate_day08, 9: generate_day09, 10: generate_day10,
+    11: generate_day11, 12: generate_day12, 13: generate_day13, 14: generate_day14, 15: generate_day15,
+    16: generate_day16, 17: generate_day17, 18: generate_day18, 19: generate_day19, 20: generate_day20,
+    21: generate_day21, 22: generate_day22, 23: generate_day23, 24: generate_day24, 25: generate_day25,
+}
@@ -0,0 +1,128 @@
+import importlib
+import os
+import re
+
+from runner import cache
+from runner.mapped import MappedInput
+
+solution_pattern = re.compile(r'day([0-9]{2})[/\\]solution([0-9]+)\.py')
+backends = ['python', 'numpy']
+# bytes read at a time for solutions that take their input in chunks
+chunk_size = 2**20
+
+
+def get_solution(day, solution):
+    return importlib.import_module(get_module_name(day, solution))
+
+
+def get_backend(solution, backend):
+    """Return the run() function of the solution written for another backend, e.g. dayNN/solutionM_numpy.py,
+    or None when there isn't one or the libraries it needs aren't installed."""
+    module_name = f'{solution.__name__}_{backend}'
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        if e.name not in (module_name, backend):
+            raise
+        return None
+    return module.run
+
+
+def get_module_name(day, solution):
+    return f'day{day:02d}.solution{solution}'
+
+
+def get_solution_path(day, solution):
+    return os.path.join(f'day{day:02d}', f'solution{solution}.py')
+
+
+def get_input_path(day, input_id):
+    file_name = f'input_{input_id}.txt'
+    return os.path.join(f'day{day:02d}', file_name)
+
+
+def get_input_lines(day, input_id):
+    with MappedInput(get_input_path(day, input_id)) as mapped:
+        return mapped.lines()
+
+
+def prepare_call(solution, day, input_id, use_cache=True, stream=False, backend='python', buffer=False, workers=None):
+    """Return the function that produces the answer and the arguments to call it with.
+    Solutions that split their work into parse() and solve() have the parse step cached.
+    When streaming, solutions that provide run_chunks() are given a lazy iterator over fixed-size blocks of the
+    input file's bytes, and solutions that provide run_stream() one over the lines.
+    With buffer, solutions that provide run_buffer() are given the input file mapped into memory.
+    For a backend other than 'python', its version of the solution is used if there is one.
+    With workers, solutions that provide run_parallel() are given the input file's path to split among that many
+    processes."""
+    if workers and hasattr(solution, 'run_parallel'):
+        return solution.run_parallel, [get_input_path(day, input_id), workers]
+    if buffer and hasattr(solution, 'run_buffer'):
+        mapped = MappedInput(get_input_path(day, input_id))
+        return close_after(solution.run_buffer, mapped), [mapped.buffer]
+    if backend != 'python' and (function := get_backend(solution, backend)) is not None:
+        return function, [get_input_lines(day, input_id)]
+    if stream and hasattr(solution, 'run_chunks'):
+        return solution.run_chunks, [iter_input_chunks(day, input_id)]
+    if stream and hasattr(solution, 'run_stream'):
+        return solution.run_stream, [iter_input_lines(day, input_id)]
+    if hasattr(solution, 'parse'):
+        input_path = get_input_path(day, input_id)
+        if use_cache:
+            parsed = cache.parse_with_cache(solution, input_path, lambda: get_input_lines(day, input_id))
+        else:
+            parsed = solution.parse(get_input_lines(day, input_id))
+        return solution.solve, [parsed]
+    return solution.run, [get_input_lines(day, input_id)]
+
+
+def close_after(function, resource):
+    """Wrap a function so that resource, which only it uses, is closed once it returns."""
+    def wrapper(*arguments):
+        try:
+            return function(*arguments)
+        finally:
+            resource.close()
+    return wrapper
+
+
+def iter_input_lines(day, input_id):
+    """Yield the input lines one at a time, so memory use doesn't grow with the size of the input."""
+    with open(get_input_path(day, input_id)) as file:
+        for line in file:
+            yield line.strip()
+
+
+def iter_input_chunks(day, input_id, size=chunk_size):
+    """Yield the input file's bytes a block at a time, with no regard for where lines end."""
+    with open(get_input_path(day, input_id), 'rb') as file:
+        while chunk := file.read(size):
+            yield chunk
+
+
+def discover_solutions(days=None):
+    """Find every dayNN/solutionM.py, ordered by day and then by solution."""
+    result = []
+    for entry in os.scandir('.'):
+        if not entry.is_dir() or not entry.name.startswith('day'):
+            continue
+        for file in os.scandir(entry.path):
+            if match := solution_pattern.search(file.path):
+                day, solution = int(match.group(1)), int(match.group(2))
+                if days is None or day in days:
+                    result.append((day, solution))
+    return sorted(result)
+
+
+def is_interactive(solution):
+    """Interactive solutions wait on the keyboard, so they can't be run unattended."""
+    return getattr(solution, 'interactive', False)
+
+
+def parse_days(text):
+    """Turn a day specification such as '1-25' or '3,5,7-9' into a set of days."""
+    result = set()
+    for part in text.split(','):
+        first, _, last = part.partition('-')
+        result.update(range(int(first), int(last or first) + 1))
+    return result
@@ -0,0 +1,38 @@
+import mmap
+
+
+class MappedInput:
+    """An input file mapped into memory rather than read. buffer is the whole file, which bytes regexes can scan
+    directly without copying it, and lines() decodes it straight from the mapping into the usual list of
+    stripped lines."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            try:
+                self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files can't be mapped
+                self.buffer = b''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+    def lines(self) -> list[str]:
+        with memoryview(self.buffer) as view:
+            return split_lines(view)
+
+
+def split_lines(data) -> list[str]:
+    """Decode a whole input, given as bytes or any other buffer, and split it into stripped lines, the same as
+    reading it a line at a time would."""
+    lines = str(data, 'utf-8').split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    return [line.strip() for line in lines]
@@ -0,0 +1,40 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+import time
+
+from runner.bench import silenced
+from runner.loader import discover_solutions, get_input_path, get_solution, is_interactive, prepare_call
+
+
+def run_all(input_id, days=None, workers=None, on_result=None, use_cache=True):
+    """Run every solution that has an input file with the given id across a pool of processes.
+    on_result is called as each solution finishes; the returned results are ordered by day and solution."""
+    jobs = [(day, solution) for day, solution in discover_solutions(days)
+            if os.path.exists(get_input_path(day, input_id))]
+    result = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [executor.submit(solve, day, solution, input_id, use_cache) for day, solution in jobs]
+        for future in as_completed(futures):
+            item = future.result()
+            if item is None:
+                continue
+            if on_result is not None:
+                on_result(item)
+            result.append(item)
+    return sorted(result, key=lambda item: (item['day'], item['solution']))
+
+
+def solve(day, solution_number, input_id, use_cache):
+    """Worker side: run one solution, returning None for interactive ones."""
+    solution = get_solution(day, solution_number)
+    if is_interactive(solution):
+        return None
+    function, arguments = prepare_call(solution, day, input_id, use_cache)
+    start = time.perf_counter_ns()
+    try:
+        with silenced():
+            answer = str(function(*arguments))
+    except Exception as e:
+        answer = f'{type(e).__name__}: {e}'
+    elapsed = time.perf_counter_ns() - start
+    return {'day': day, 'solution': solution_number, 'answer': answer, 'solve_ns': elapsed}
@@ -0,0 +1,99 @@
+from collections import Counter
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+
+
+def run_with_profile(function, arguments, top, path):
+    """Run under cProfile, print the top functions by cumulative time and write the stats to path."""
+    profile = cProfile.Profile()
+    result = profile.runcall(function, *arguments)
+    profile.dump_stats(path)
+    print(f'--- cProfile, top {top} by cumulative time (stats written to {path}) ---')
+    pstats.Stats(profile, stream=sys.stdout).sort_stats('cumulative').print_stats(top)
+    return result
+
+
+def run_with_memory(function, arguments, top):
+    """Run under tracemalloc, print the peak traced memory and the lines that allocated the most."""
+    tracemalloc.start()
+    try:
+        result = function(*arguments)
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    print(f'--- tracemalloc, peak {peak / 2**20:.1f} MiB, top {top} allocation sites still alive at the end ---')
+    for statistic in snapshot.statistics('lineno')[:top]:
+        print(statistic)
+    return result
+
+
+def run_with_sampler(function, arguments, top, interval):
+    """Run while a background thread samples the call stack every interval seconds. Functions are
+    ranked by how often they were seen running (self) and on the stack at all (total)."""
+    sampler = Sampler(threading.get_ident(), interval)
+    # the sampler can only look at the stack when it gets the GIL, so hand it over more often
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(switch_interval, interval / 2))
+    sampler.start()
+    try:
+        result = function(*arguments)
+    finally:
+        sampler.stop()
+        sys.setswitchinterval(switch_interval)
+    print(f'--- sampler, {sampler.samples} samples every {interval * 1000:g} ms, top {top} ---')
+    print(f"{'self':>6}  {'total':>6}  function")
+    for location, count in sampler.total.most_common(top):
+        print(f'{sampler.own[location]:>6}  {count:>6}  {location}')
+    return result
+
+
+class Sampler(threading.Thread):
+
+    def __init__(self, thread_id, interval):
+        super().__init__(daemon=True)
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stopped = threading.Event()
+        self.samples = 0
+        self.own = Counter()
+        self.total = Counter()
+
+    def run(self):
+        while not self._stopped.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            self.samples += 1
+            self.own[describe(frame)] += 1
+            # recursive functions should only count once per sample
+            seen = set()
+            while frame is not None and frame.f_code is not run_with_sampler.__code__:
+                seen.add(describe(frame))
+                frame = frame.f_back
+            self.total.update(seen)
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+
+def describe(frame):
+    code = frame.f_code
+    return f'{os.path.relpath(code.co_filename)}:{code.co_firstlineno}({code.co_name})'
+
+
+def get_peak_rss():
+    """The most memory this process has had resident, in bytes, or None on platforms without the resource module."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes and macOS reports bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
@@ -0,0 +1,61 @@
+import math
+import random
+import sys
+import time
+
+from runner.bench import silenced
+from runner.generate import generators
+from runner.loader import discover_solutions, get_solution, is_interactive
+
+
+def measure_scaling(days, scales, seed=0, runs=3):
+    """Time each solution on generated inputs at each scale, keeping the fastest of runs attempts.
+    Returns one result per solution, with its timings and the exponent fitted to them."""
+    result = []
+    inputs = {}
+    for day, solution_number in discover_solutions(days):
+        if day not in generators:
+            continue
+        solution = get_solution(day, solution_number)
+        if is_interactive(solution):
+            continue
+        points = []
+        for scale in scales:
+            if (day, scale) not in inputs:
+                inputs[(day, scale)] = generators[day](scale, random.Random(f'{seed}-{day}'))
+            lines = inputs[(day, scale)]
+            print(f'Timing day {day} solution {solution_number} at scale {scale:g}', file=sys.stderr)
+            points.append((scale, sum(len(line) + 1 for line in lines), time_run(solution, lines, runs)))
+        result.append({
+            'day': day,
+            'solution': solution_number,
+            'points': points,
+            'exponent': fit_exponent([(size, seconds) for _, size, seconds in points]),
+        })
+    return result
+
+
+def time_run(solution, lines, runs):
+    result = None
+    for _ in range(runs):
+        # solutions are free to consume or modify their input, so each run gets a fresh copy
+        copy = list(lines)
+        with silenced():
+            start = time.perf_counter()
+            solution.run(copy)
+            elapsed = time.perf_counter() - start
+        result = elapsed if result is None else min(result, elapsed)
+    return result
+
+
+def fit_exponent(points):
+    """Least squares slope of log(time) against log(size): time grows like size ** slope.
+    Returns None when there aren't two different sizes to compare."""
+    points = [(math.log(size), math.log(max(seconds, 1e-9))) for size, seconds in points]
+    if len({x for x, _ in points}) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    return covariance / variance
@@ -0,0 +1,26 @@
+import os
+
+import pytest
+
+from runner.answers import get_paths, load_answers, run_path
+from runner.loader import discover_solutions, get_input_path, get_solution
+
+
+def get_recorded():
+    """Every recorded answer whose input file is present. Inputs aren't committed, so which ones are checked
+    depends on what has been downloaded or generated: `main.py generate --scale 0.2` and `--scale 1` make the
+    gen0.2 and gen1 inputs."""
+    result = []
+    for day, solution_number in discover_solutions():
+        for input_id, expected in load_answers(day).items():
+            if str(solution_number) in expected and os.path.exists(get_input_path(day, input_id)):
+                result.append((day, solution_number, input_id, expected[str(solution_number)]))
+    return result
+
+
+@pytest.mark.parametrize('day, solution_number, input_id, expected', get_recorded())
+def test_every_path_gives_the_recorded_answer(day, solution_number, input_id, expected):
+    solution = get_solution(day, solution_number)
+    for path, options in get_paths(solution):
+        answer, _, _ = run_path(solution, day, input_id, options)
+        assert answer == expected, f'{path} path'